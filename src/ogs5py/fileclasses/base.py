@@ -193,8 +193,7 @@ class File:
         # update the content
         self._update_out()
         # create the file path
-        if not os.path.exists(self.task_root):
-            os.makedirs(self.task_root)
+        os.makedirs(self.task_root, exist_ok=True)
         f_path = self.file_path
         # check if we can copy the file or if we need to write it from data
         if self.copy_file is None:
@@ -326,8 +325,7 @@ class LineFile(File):
         """
         if self.lines:
             with open(path, "w") as fout:
-                for line in self.lines:
-                    print(line, file=fout)
+                fout.writelines(f"{line}\n" for line in self.lines)
 
     def read_file(self, path, encoding=None, verbose=False):
         """
@@ -1192,6 +1190,13 @@ class MultiFile:
         self._list.append(file)
         self.id = 0 if self.id is None else self.id + 1
 
+    def extend(self, files):
+        """Append multiple new files to the list."""
+        files = list(files)
+        if files:
+            self._list.extend(files)
+            self.id = -1
+
     def delete(self, file_id=-1):
         """Delete a certain file."""
         file_id = int(file_id) if file_id >= 0 else len(self) + int(file_id)
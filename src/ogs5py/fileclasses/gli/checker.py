@@ -2,7 +2,7 @@
 """Checking routines for the ogs5py-GLI package."""
 import numpy as np
 
-from ogs5py.tools.types import GLI_KEYS, PLY_KEYS, SRF_KEYS, STRTYPE, VOL_KEYS
+from ogs5py.tools.types import GLI_KEYS, PLY_KEYS, SRF_KEYS, VOL_KEYS
 
 
 def has_whitespaces(string):
@@ -20,7 +20,7 @@ def has_whitespaces(string):
         True if whitespaces apear.
         False if no whitespaces or string ist not of type str.
     """
-    if not isinstance(string, STRTYPE):
+    if not isinstance(string, str):
         print(str(string) + " (" + str(type(string)) + ") is not a string!")
         return False
     has_ws = False
@@ -85,7 +85,7 @@ def check_polyline(ply, point_cnt, verbose=True):
         return False
     # check NAME
     if (
-        isinstance(ply["NAME"], STRTYPE)
+        isinstance(ply["NAME"], str)
         and not has_whitespaces(ply["NAME"])
         and len(ply["NAME"]) > 0
     ):
@@ -160,7 +160,7 @@ def check_polyline(ply, point_cnt, verbose=True):
             print("  ply['MAT_GROUP'] not valid")
         return False
     # check POINT_VECTOR
-    if ply["POINT_VECTOR"] is None or isinstance(ply["POINT_VECTOR"], STRTYPE):
+    if ply["POINT_VECTOR"] is None or isinstance(ply["POINT_VECTOR"], str):
         if verbose:
             print("  ply['POINT_VECTOR'] valid")
     else:
@@ -233,7 +233,7 @@ def check_surface(srf, ply_names, verbose=True):
         return False
     # check NAME
     if (
-        isinstance(srf["NAME"], STRTYPE)
+        isinstance(srf["NAME"], str)
         and not has_whitespaces(srf["NAME"])
         and len(srf["NAME"]) > 0
     ):
@@ -290,7 +290,7 @@ def check_surface(srf, ply_names, verbose=True):
             print("  srf['MAT_GROUP'] not valid")
         return False
     # check TIN
-    if srf["TIN"] is None or isinstance(srf["TIN"], STRTYPE):
+    if srf["TIN"] is None or isinstance(srf["TIN"], str):
         if verbose:
             print("  srf['TIN'] valid")
     else:
@@ -359,7 +359,7 @@ def check_volume(vol, srf_names, verbose=True):
         return False
     # check NAME
     if (
-        isinstance(vol["NAME"], STRTYPE)
+        isinstance(vol["NAME"], str)
         and not has_whitespaces(vol["NAME"])
         and len(vol["NAME"]) > 0
     ):
@@ -527,7 +527,7 @@ def check_gli_dict(gli, verbose=True):
     ):
         names_valid = True
         for name in gli["point_names"]:
-            names_valid &= isinstance(name, STRTYPE)
+            names_valid &= isinstance(name, str)
             names_valid &= not has_whitespaces(name)
         if names_valid:
             if verbose:
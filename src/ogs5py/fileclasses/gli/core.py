@@ -22,7 +22,7 @@ from ogs5py.tools.tools import (
 )
 
 # import ogs5py.fileclasses.gli.generator as gen
-from ogs5py.tools.types import EMPTY_GLI, STRTYPE
+from ogs5py.tools.types import EMPTY_GLI
 
 # current working directory
 CWD = os.getcwd()
@@ -812,7 +812,7 @@ class GLI(File):
         index_list = []
         for pnt in id_or_name:
             index = -1
-            if isinstance(pnt, STRTYPE) and pnt in self.POINT_NAMES:
+            if isinstance(pnt, str) and pnt in self.POINT_NAMES:
                 index = list(self.POINT_NAMES).index(pnt)
             else:
                 try:
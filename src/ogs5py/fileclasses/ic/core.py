@@ -6,7 +6,6 @@ import numpy as np
 import pandas as pd
 
 from ogs5py.fileclasses.base import BlockFile, File
-from ogs5py.tools.types import STRTYPE
 
 CWD = os.getcwd()
 
@@ -185,7 +184,7 @@ class RFR(File):
             self._variables = []
         else:
             # strings could be detected as iterable, so check this first
-            if isinstance(var, STRTYPE):
+            if isinstance(var, str):
                 var = [var]
             # convert iterators (like zip)
             try:
@@ -208,7 +207,7 @@ class RFR(File):
         if not self.variables:  # no units without variables
             units = []
         # strings could be detected as iterable, so check this first
-        if isinstance(units, STRTYPE):
+        if isinstance(units, str):
             units = [units]
         # convert iterators (like zip)
         try:
@@ -324,12 +323,14 @@ class RFR(File):
                 unit = var_info.pop(0)
                 variables.append(var)
                 units.append(unit)
+            # parse the data from the already opened file (first column: ids)
+            data = np.loadtxt(fin, dtype=float, ndmin=2)[:, 1:].T
         if verbose:
             print("RFR.read_file: reading was fine.")
         self.headers = headers
         self.variables = variables
         self.units = units
-        self.data = np.loadtxt(path, dtype=float, skiprows=4)[:, 1:].T
+        self.data = data
         if verbose:
             print("RFR.read_file: data conversion was fine.")
 
@@ -3,13 +3,7 @@
 import numpy as np
 
 from ogs5py.fileclasses.msh.tools import no_of_elements
-from ogs5py.tools.types import (
-    ELEMENT_KEYS,
-    MESH_DATA_KEYS,
-    MESH_KEYS,
-    NODE_NO,
-    STRTYPE,
-)
+from ogs5py.tools.types import ELEMENT_KEYS, MESH_DATA_KEYS, MESH_KEYS, NODE_NO
 
 
 def check_mesh_list(meshlist, verbose=True):
@@ -184,7 +178,7 @@ def check_mesh_dict(mesh, verbose=True):
     # check PCS_TYPE
     if "PCS_TYPE" in in_mesh_data_keys:
         if (
-            isinstance(mesh["mesh_data"]["PCS_TYPE"], STRTYPE)
+            isinstance(mesh["mesh_data"]["PCS_TYPE"], str)
             and " " not in mesh["mesh_data"]["PCS_TYPE"]
         ):
             if verbose:
@@ -198,7 +192,7 @@ def check_mesh_dict(mesh, verbose=True):
     # check GEO_TYPE
     if "GEO_TYPE" in in_mesh_data_keys:
         if (
-            isinstance(mesh["mesh_data"]["GEO_TYPE"], STRTYPE)
+            isinstance(mesh["mesh_data"]["GEO_TYPE"], str)
             and " " not in mesh["mesh_data"]["GEO_TYPE"]
         ):
             if verbose:
@@ -212,7 +206,7 @@ def check_mesh_dict(mesh, verbose=True):
     # check GEO_NAME
     if "GEO_NAME" in in_mesh_data_keys:
         if (
-            isinstance(mesh["mesh_data"]["GEO_NAME"], STRTYPE)
+            isinstance(mesh["mesh_data"]["GEO_NAME"], str)
             and " " not in mesh["mesh_data"]["GEO_NAME"]
         ):
             if verbose:
@@ -84,8 +84,7 @@ class PCT(File):
         """
         if not self.is_empty:
             with open(path, "w") as fout:
-                print(str(self.s_flag), file=fout)
-                print(str(self.data.shape[0]), file=fout)
+                fout.write(f"{self.s_flag}\n{self.data.shape[0]}\n")
                 np.savetxt(fout, self.data)
 
     def read_file(self, path, **kwargs):
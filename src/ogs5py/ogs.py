@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
 """Base Class for an OGS5 run."""
-import glob
+import functools
+import io
+import itertools
 import os
 import shutil
+import stat
+import subprocess
 import sys
+import threading
 import time
 import warnings
-from copy import deepcopy as dcp
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 
 import pexpect
 from pexpect.popen_spawn import PopenSpawn
@@ -44,8 +50,8 @@ from ogs5py.fileclasses import (
 from ogs5py.fileclasses.base import BOT_COM, CWD, TOP_COM, MultiFile
 from ogs5py.tools.download import OGS5PY_CONFIG
 from ogs5py.tools.script import gen_script
-from ogs5py.tools.tools import Output, search_task_id
-from ogs5py.tools.types import MULTI_FILES, OGS_EXT
+from ogs5py.tools.tools import Output, search_task_id, sub_key_index
+from ogs5py.tools.types import MULTI_FILES, OGS_ATTRS, OGS_EXT
 
 # pexpect.spawn just runs on unix-like systems
 if sys.platform == "win32":
@@ -55,6 +61,119 @@ else:
     OGS_NAME = "ogs"
     CmdRun = pexpect.spawn
 
+# file classes of the model by attribute name (one for each OGS_EXT)
+OGS_FILES = {
+    "msh": MSH,
+    "gli": GLI,
+    "ddc": DDC,
+    "pcs": PCS,
+    "rfd": RFD,
+    "cct": CCT,
+    "fct": FCT,
+    "bc": BC,
+    "ic": IC,
+    "st": ST,
+    "mmp": MMP,
+    "msp": MSP,
+    "mfp": MFP,
+    "mcp": MCP,
+    "gem": GEM,
+    "krc": KRC,
+    "pqc": PQC,
+    "rei": REI,
+    "pct": PCT,
+    "num": NUM,
+    "tim": TIM,
+    "out": OUT,
+}
+# pairs of file extension and attribute name of the ogs files
+_OGS_PAIRS = tuple(zip(OGS_EXT, OGS_ATTRS))
+
+
+@functools.lru_cache(maxsize=None)
+def _forced_writing(name):
+    """State if a new (empty) ogs file of the given attribute is written."""
+    return OGS_FILES[name]().force_writing
+
+
+@functools.lru_cache(maxsize=None)
+def _which_ogs(ogs_name):
+    """Look up the ogs executable in the ogs5py config path and sys path."""
+    return shutil.which(ogs_name, path=OGS5PY_CONFIG) or shutil.which(ogs_name)
+
+
+def _copy_file(src, dst):
+    """Copy a file while keeping its content in the kernel if possible."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                while size > 0:
+                    sent = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), size
+                    )
+                    if not sent:
+                        break
+                    size -= sent
+            return
+        except OSError:
+            pass  # not supported (by the file system), so copy with shutil
+    # shutil itself uses sendfile/fcopyfile where available
+    shutil.copyfile(src, dst)
+
+
+def _run_silent(args, log, cwd, timeout):
+    """Run a command with its output only written to the log (or nowhere)."""
+    # the raw bytes of ogs are passed through without decoding
+    log_file = subprocess.DEVNULL if log is None else open(log, "wb")
+    try:
+        child = subprocess.Popen(
+            args, stdout=log_file, stderr=subprocess.STDOUT, cwd=cwd
+        )
+        try:
+            return child.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            child.kill()
+            child.wait()
+            raise
+    finally:
+        if log is not None:
+            log_file.close()
+
+
+def _run_piped(args, out, cwd, timeout):
+    """Run a command and pass its output line by line to the given stream."""
+    child = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        cwd=cwd,
+        bufsize=io.DEFAULT_BUFFER_SIZE,
+    )
+    # a blocking readline can't time out, so kill the process from a timer
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        child.kill()
+
+    timer = None if timeout is None else threading.Timer(timeout, kill)
+    if timer is not None:
+        timer.start()
+    try:
+        for line in iter(child.stdout.readline, b""):
+            out.write(line)
+    finally:
+        child.stdout.close()
+        exitstatus = child.wait()
+        if timer is not None:
+            timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout)
+    return exitstatus
+
 
 class OGS:
     """Class for an OGS5 model.
@@ -75,7 +194,7 @@ class OGS:
 
     Notes
     -----
-    The following Classes are present as attributes
+    The following Classes are present as attributes (created on first access)
         bc  : Boundary Condition
             Information of the Boundary Conditions for the model.
         cct : Communication Table
@@ -139,6 +258,24 @@ class OGS:
             Files that should be copied to the destiny folder.
     """
 
+    # "__dict__" is kept to allow setting custom attributes on a model
+    __slots__ = (
+        "__dict__",
+        "_task_root",
+        "_task_id",
+        "_output_dir",
+        "_top_com",
+        "_bot_com",
+        "exitstatus",
+        "pqcdat",
+        "mpd",
+        "gli_ext",
+        "rfr",
+        "gem_init",
+        "asc",
+        "copy_files",
+    ) + tuple(OGS_FILES)
+
     def __init__(self, task_root=None, task_id="model", output_dir=None):
         if task_root is None:
             task_root = os.path.join(CWD, "ogs5model")
@@ -148,29 +285,12 @@ class OGS:
         self.output_dir = output_dir
         self.exitstatus = None
 
-        self.bc = BC(task_root=task_root, task_id=task_id)
-        self.cct = CCT(task_root=task_root, task_id=task_id)
-        self.ddc = DDC(task_root=task_root, task_id=task_id)
-        self.fct = FCT(task_root=task_root, task_id=task_id)
-        self.gem = GEM(task_root=task_root, task_id=task_id)
-        self.gli = GLI(task_root=task_root, task_id=task_id)
-        self.ic = IC(task_root=task_root, task_id=task_id)
-        self.krc = KRC(task_root=task_root, task_id=task_id)
-        self.mcp = MCP(task_root=task_root, task_id=task_id)
-        self.mfp = MFP(task_root=task_root, task_id=task_id)
-        self.mmp = MMP(task_root=task_root, task_id=task_id)
-        self.msh = MSH(task_root=task_root, task_id=task_id)
-        self.msp = MSP(task_root=task_root, task_id=task_id)
-        self.num = NUM(task_root=task_root, task_id=task_id)
-        self.out = OUT(task_root=task_root, task_id=task_id)
-        self.pcs = PCS(task_root=task_root, task_id=task_id)
-        self.pct = PCT(task_root=task_root, task_id=task_id)
-        self.pqc = PQC(task_root=task_root, task_id=task_id)
+        # store the Top Comment
+        self._top_com = TOP_COM
+        # store the Bottom Comment
+        self._bot_com = BOT_COM
+        # files with an OGS_EXT extension are created on first access
         self.pqcdat = PQCdat(task_root=task_root, task_id=task_id)
-        self.rei = REI(task_root=task_root, task_id=task_id)
-        self.rfd = RFD(task_root=task_root, task_id=task_id)
-        self.st = ST(task_root=task_root, task_id=task_id)
-        self.tim = TIM(task_root=task_root, task_id=task_id)
 
         # create a list for mpd files
         self.mpd = MultiFile(MPD, task_root=task_root, task_id=task_id)
@@ -186,10 +306,31 @@ class OGS:
         self.asc = MultiFile(ASC, task_root=task_root, task_id=task_id)
         # create a list of arbitrary files to be copied (names will be same)
         self.copy_files = []
-        # store the Top Comment
-        self._top_com = TOP_COM
-        # store the Bottom Comment
-        self._bot_com = BOT_COM
+
+    def __getattr__(self, name):
+        """Create the OGS file classes on first access."""
+        if name not in OGS_FILES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        ogs_file = OGS_FILES[name](
+            task_root=self._task_root, task_id=self._task_id
+        )
+        ogs_file.top_com = self._top_com
+        ogs_file.bot_com = self._bot_com
+        setattr(self, name, ogs_file)
+        return ogs_file
+
+    def _created_files(self):
+        """Get the OGS files that were already created or set."""
+        files = []
+        for name in OGS_ATTRS:
+            try:
+                # bypass __getattr__ to not create missing files
+                files.append(object.__getattribute__(self, name))
+            except AttributeError:
+                pass
+        return files
 
     @property
     def top_com(self):
@@ -199,9 +340,8 @@ class OGS:
     @top_com.setter
     def top_com(self, value):
         self._top_com = value
-        for ext in OGS_EXT:
-            # workaround to get access to class-members by name
-            getattr(self, ext[1:]).top_com = value
+        for ogs_file in self._created_files():
+            ogs_file.top_com = value
 
     @property
     def bot_com(self):
@@ -211,9 +351,8 @@ class OGS:
     @bot_com.setter
     def bot_com(self, value):
         self._bot_com = value
-        for ext in OGS_EXT:
-            # workaround to get access to class-members by name
-            getattr(self, ext[1:]).bot_com = value
+        for ogs_file in self._created_files():
+            ogs_file.bot_com = value
 
     @property
     def task_root(self):
@@ -222,15 +361,16 @@ class OGS:
 
     @task_root.setter
     def task_root(self, value):
-        self._task_root = value
-        for ext in OGS_EXT:
-            # workaround to get access to class-members by name
-            getattr(self, ext[1:]).task_root = value
-        for ext in MULTI_FILES:
-            getattr(self, ext).standard["task_root"] = value
-            for i in range(len(getattr(self, ext))):
-                getattr(self, ext)[i].task_root = value
-        self.pqcdat.task_root = value
+        # normalize once here instead of in every file
+        value = self._task_root = os.path.normpath(value)
+        multi_files = [getattr(self, ext) for ext in MULTI_FILES]
+        for multi_file in multi_files:
+            multi_file.standard["task_root"] = value
+        # update all files in one pass
+        for ogs_file in itertools.chain(
+            self._created_files(), (self.pqcdat,), *multi_files
+        ):
+            ogs_file.task_root = value
 
     @property
     def task_id(self):
@@ -240,11 +380,11 @@ class OGS:
     @task_id.setter
     def task_id(self, value):
         # workaround for asc
-        for i in range(len(self.asc)):
-            self.asc[i].name = value + self.asc[i].name[len(self._task_id) :]
+        for asc_file in self.asc:
+            asc_file.name = value + asc_file.name[len(self._task_id) :]
         self._task_id = value
-        for ext in OGS_EXT:
-            getattr(self, ext[1:]).task_id = value
+        for ogs_file in self._created_files():
+            ogs_file.task_id = value
         for ext in MULTI_FILES:
             getattr(self, ext).standard["task_id"] = value
 
@@ -262,7 +402,7 @@ class OGS:
             if not os.path.isabs(self._output_dir):
                 # if not, put the outputfolder in the task_root
                 self._output_dir = os.path.join(
-                    os.path.abspath(self.task_root), self._output_dir
+                    os.path.abspath(self._task_root), self._output_dir
                 )
 
     @property
@@ -270,6 +410,18 @@ class OGS:
         """:class:`bool`: State if the model has a output directory."""
         return self.output_dir is not None
 
+    def _add_file(self, ext_file, cls, target):
+        """Add an external file of the given class to the target list."""
+        if not isinstance(ext_file, cls):
+            raise TypeError(
+                "ogs5py.OGS: given file needs to be of type "
+                + cls.__name__
+                + ", got: "
+                + type(ext_file).__name__
+            )
+        ext_file.task_root = self._task_root
+        target.append(ext_file)
+
     def add_copy_file(self, path):
         """
         Method to add an arbitrary file that should be copied.
@@ -277,10 +429,33 @@ class OGS:
         The base-name of the file will be keept and it will be copied to
         the task-root when the "write" routine is called.
         """
-        if os.path.isfile(path):
-            self.copy_files.append(os.path.abspath(path))
-        else:
-            print("OGS.add_copy_file: given file is not valid: " + str(path))
+        self.add_copy_files([path])
+
+    def add_copy_files(self, paths):
+        """
+        Method to add multiple arbitrary files that should be copied.
+
+        The base-names of the files will be keept and they will be copied to
+        the task-root when the "write" routine is called.
+
+        Parameters
+        ----------
+        paths : list of str
+            Paths to the files. Paths that are no regular file are skipped.
+        """
+        valid = []
+        for path in paths:
+            try:
+                is_file = stat.S_ISREG(os.stat(path).st_mode)
+            except (OSError, ValueError):
+                is_file = False
+            if is_file:
+                valid.append(os.path.abspath(path))
+            else:
+                print(
+                    "OGS.add_copy_file: given file is not valid: " + str(path)
+                )
+        self.copy_files.extend(valid)
 
     def del_copy_file(self, index=None):
         """
@@ -307,9 +482,7 @@ class OGS:
 
         See ogs5py.MPD for further information
         """
-        if isinstance(mpd_file, MPD):
-            mpd_file.task_root = self.task_root
-            self.mpd.append(mpd_file)
+        self._add_file(mpd_file, MPD, self.mpd)
 
     def del_mpd(self, index=None):
         """
@@ -337,9 +510,7 @@ class OGS:
 
         See ogs5py.GLI for further information
         """
-        if isinstance(gli_ext_file, GLIext):
-            gli_ext_file.task_root = self.task_root
-            self.gli_ext.append(gli_ext_file)
+        self._add_file(gli_ext_file, GLIext, self.gli_ext)
 
     def del_gli_ext(self, index=None):
         """
@@ -366,9 +537,7 @@ class OGS:
 
         See ogs5py.IC for further information
         """
-        if isinstance(rfr_file, RFR):
-            rfr_file.task_root = self.task_root
-            self.rfr.append(rfr_file)
+        self._add_file(rfr_file, RFR, self.rfr)
 
     def del_rfr(self, index=None):
         """
@@ -395,9 +564,7 @@ class OGS:
 
         See ogs5py.GEM and ogs5py.GEMinit for further information
         """
-        if isinstance(gem_init_file, GEMinit):
-            gem_init_file.task_root = self.task_root
-            self.gem_init.append(gem_init_file)
+        self._add_file(gem_init_file, GEMinit, self.gem_init)
 
     def del_gem_init(self, index=None):
         """
@@ -422,9 +589,7 @@ class OGS:
 
         See ogs5py.ASC for further information
         """
-        if isinstance(asc_file, ASC):
-            asc_file.task_root = self.task_root
-            self.asc.append(asc_file)
+        self._add_file(asc_file, ASC, self.asc)
 
     def del_asc(self, index=None):
         """
@@ -445,9 +610,8 @@ class OGS:
 
     def reset(self):
         """Delete every content."""
-        for ext in OGS_EXT:
-            # workaround to get access to class-members by name
-            getattr(self, ext[1:]).reset()
+        for ogs_file in self._created_files():
+            ogs_file.reset()
         for ext in MULTI_FILES:
             getattr(self, ext).reset_all()
         self.pqcdat.reset()
@@ -461,37 +625,51 @@ class OGS:
 
     def write_input(self):
         """Method to call all write_file() methods that are initialized."""
-        for ext in OGS_EXT:
-            # workaround to get access to class-members by name
-            ogs_file = getattr(self, ext[1:])
-            if ogs_file.is_empty and ogs_file.force_writing:
+        # files that were never accessed are empty and only need to be
+        # created if they are written anyway (e.g. pcs, tim, bc)
+        # (emptiness is checked once per file, since it may be costly)
+        files = []
+        for name in OGS_ATTRS:
+            try:
+                ogs_file = object.__getattribute__(self, name)
+            except AttributeError:
+                if not _forced_writing(name):
+                    continue
+                ogs_file = getattr(self, name)
+            if not ogs_file.is_empty:
+                files.append(ogs_file)
+                continue
+            if ogs_file.force_writing:
                 warnings.warn(
-                    self.task_id
-                    + ext
+                    self._task_id
+                    + ogs_file.file_ext
                     + ": file is empty, but forced to be written!"
                 )
-            getattr(self, ext[1:]).write_file()
-
-        self.pqcdat.write_file()
-
-        for mpd_file in self.mpd:
-            mpd_file.write_file()
-
-        for gli_ext_file in self.gli_ext:
-            gli_ext_file.write_file()
-
-        for rfr_file in self.rfr:
-            rfr_file.write_file()
-
-        for gem_init_file in self.gem_init:
-            gem_init_file.write_file()
-
-        for asc_file in self.asc:
-            asc_file.write_file()
-
+            # skip files that would be neither written nor copied
+            if ogs_file.force_writing or ogs_file.copy_file is not None:
+                files.append(ogs_file)
+        multi_files = [getattr(self, ext) for ext in MULTI_FILES]
+        for ogs_file in itertools.chain((self.pqcdat,), *multi_files):
+            if (
+                not ogs_file.is_empty
+                # GEMinit is not derived from File and has no copy/force flags
+                or getattr(ogs_file, "copy_file", None) is not None
+                or getattr(ogs_file, "force_writing", False)
+            ):
+                files.append(ogs_file)
+        tasks = [ogs_file.write_file for ogs_file in files]
+        dest_root = os.path.join(self._task_root, "")
         for copy_file in self.copy_files:
-            base = os.path.basename(copy_file)
-            shutil.copyfile(copy_file, os.path.join(self.task_root, base))
+            dest = dest_root + os.path.basename(copy_file)
+            tasks.append(functools.partial(_copy_file, copy_file, dest))
+        # the model folder should exist, even if no file is written
+        os.makedirs(self._task_root, exist_ok=True)
+        if tasks:
+            # all files are independent, so they can be written concurrently
+            workers = min(32, (os.cpu_count() or 1) * 4, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # consume the results to raise errors from the writers
+                list(pool.map(lambda task: task(), tasks))
 
     def gen_script(
         self,
@@ -634,167 +812,196 @@ class OGS:
         if use_task_id:
             self.task_id = task_id
 
+        # scan the model folder once for all present files
+        with os.scandir(task_root) as entries:
+            found_files = {
+                entry.name: entry.path for entry in entries if entry.is_file()
+            }
+        # prefix for the (mostly relative) paths of external files
+        ext_root = os.path.join(task_root, "")
+
         # iterate over all ogs file-extensions
-        for ext in OGS_EXT:
+        to_read = []
+        for ext, name in _OGS_PAIRS:
             if verbose:
                 print(ext, end=" ")
             # skip certain file extensions if wanted
-            if ext in skip_ext or ext[1:] in skip_ext:
+            if ext in skip_ext or name in skip_ext:
                 continue
-            # search for files with given extension
-            files = glob.glob(os.path.join(task_root, task_id + ext))
+            # search for the file with given extension
+            fil = found_files.get(task_id + ext)
             # if nothing was found, skip
-            if not files:
+            if fil is None:
                 continue
-            # take the first found file if there are multiple
-            fil = files[0]
             # skip file if wanted
             if os.path.basename(fil) in skip_files or fil in skip_files:
                 continue
             # workaround to get access to class-members by name
-            getattr(self, ext[1:]).read_file(
-                fil, encoding=encoding, verbose=verbose
+            to_read.append((ext, getattr(self, name), fil))
+        read_ext = [ext for ext, __, __ in to_read]
+
+        # all files are independent, so they can be read concurrently
+        # (serially when verbose to keep the printed information in order)
+        workers = 1 if verbose else min(8, max(len(to_read), 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # consume the results to raise errors from the readers
+            list(
+                pool.map(
+                    lambda item: item[1].read_file(
+                        item[2], encoding=encoding, verbose=verbose
+                    ),
+                    to_read,
+                )
             )
 
+            def load_ext(base, ext_name):
+                return self._load_ext(base, ext_name, ext_root, encoding)
+
+            def load_gem_init(ext_name):
+                # GEMinit is named by its lst file and not by name and ext
+                ext_file = GEMinit(
+                    lst_name=ext_name, task_root=self._task_root
+                )
+                path = self._ext_path(ext_root, ext_name)
+                ext_file.read_file(path, encoding=encoding)
+                return ext_file
+
             # append GEOMETRY defnitions
-            if ext == ".gli":
-                for ply in self.gli.POLYLINES:
-                    # POINT_VECTOR definition of a POLYLINE
-                    ext_name = ply["POINT_VECTOR"]
-                    if ext_name is not None:
-                        raw_name = os.path.basename(ext_name)
-                        f_name, f_ext = os.path.splitext(raw_name)
-                        ext_file = GLIext(
-                            typ="POINT_VECTOR",
-                            name=f_name,
-                            file_ext=f_ext,
-                            task_root=self.task_root,
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.gli_ext.append(dcp(ext_file))
-                for srf in self.gli.SURFACES:
-                    # Triangulation definition of a SURFACE
-                    ext_name = srf["TIN"]
-                    if ext_name is not None:
-                        raw_name = os.path.basename(ext_name)
-                        f_name, f_ext = os.path.splitext(raw_name)
-                        ext_file = GLIext(
-                            typ="TIN",
-                            name=f_name,
-                            file_ext=f_ext,
-                            task_root=self.task_root,
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.gli_ext.append(dcp(ext_file))
+            if ".gli" in read_ext:
+                # reading replaces the data, so prototypes can be copied
+                ply_proto = GLIext("POINT_VECTOR", task_root=self._task_root)
+                tin_proto = GLIext("TIN", task_root=self._task_root)
+                # POINT_VECTOR definition of a POLYLINE
+                ext_files = [
+                    pool.submit(load_ext, ply_proto, ply["POINT_VECTOR"])
+                    for ply in self.gli.POLYLINES
+                    if ply["POINT_VECTOR"] is not None
+                ]
+                # Triangulation definition of a SURFACE
+                ext_files += [
+                    pool.submit(load_ext, tin_proto, srf["TIN"])
+                    for srf in self.gli.SURFACES
+                    if srf["TIN"] is not None
+                ]
+                self.gli_ext.extend(fut.result() for fut in ext_files)
 
             # append MEDIUM_PROPERTIES_DISTRIBUTED defnitions
-            if ext == ".mmp":
-                for i in range(len(self.mmp.mainkw)):
+            if ".mmp" in read_ext:
+                ext_names = []
+                for subkw, cont in zip(self.mmp.subkw, self.mmp.cont):
+                    index = sub_key_index(subkw)
                     # external PERMEABILITY_DISTRIBUTION
-                    if "PERMEABILITY_DISTRIBUTION" in self.mmp.subkw[i]:
-                        index = self.mmp.subkw[i].index(
-                            "PERMEABILITY_DISTRIBUTION"
-                        )
-                        ext_name = self.mmp.cont[i][index][0][0]
-                        raw_name = os.path.basename(ext_name)
-                        f_name, f_ext = os.path.splitext(raw_name)
-                        ext_file = MPD(
-                            name=f_name,
-                            file_ext=f_ext,
-                            task_root=self.task_root,
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.mpd.append(dcp(ext_file))
                     # external POROSITY_DISTRIBUTION
-                    if "POROSITY_DISTRIBUTION" in self.mmp.subkw[i]:
-                        index = self.mmp.subkw[i].index(
-                            "POROSITY_DISTRIBUTION"
-                        )
-                        ext_name = self.mmp.cont[i][index][0][0]
-                        raw_name = os.path.basename(ext_name)
-                        f_name, f_ext = os.path.splitext(raw_name)
-                        ext_file = MPD(
-                            name=f_name,
-                            file_ext=f_ext,
-                            task_root=self.task_root,
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.mpd.append(dcp(ext_file))
+                    for key in (
+                        "PERMEABILITY_DISTRIBUTION",
+                        "POROSITY_DISTRIBUTION",
+                    ):
+                        if key in index:
+                            ext_names.append(cont[index[key]][0][0])
                     # external GEOMETRY_AREA
-                    if "GEOMETRY_AREA" in self.mmp.subkw[i]:
-                        index = self.mmp.subkw[i].index("GEOMETRY_AREA")
-                        if self.mmp.cont[i][index][0][0] == "FILE":
-                            ext_name = self.mmp.cont[i][index][0][1]
-                            raw_name = os.path.basename(ext_name)
-                            f_name, f_ext = os.path.splitext(raw_name)
-                            ext_file = MPD(
-                                name=f_name,
-                                file_ext=f_ext,
-                                task_root=self.task_root,
-                            )
-                            path = os.path.join(task_root, ext_name)
-                            ext_file.read_file(path, encoding=encoding)
-                            self.mpd.append(dcp(ext_file))
+                    if "GEOMETRY_AREA" in index:
+                        geo_area = cont[index["GEOMETRY_AREA"]][0]
+                        if geo_area[0] == "FILE":
+                            ext_names.append(geo_area[1])
+                self.mpd.extend(
+                    pool.map(
+                        lambda ext_name: load_ext(MPD, ext_name), ext_names
+                    )
+                )
 
             # append GEMS3K init file
-            if ext == ".gem":
-                for i in range(len(self.gem.mainkw)):
-                    if "GEM_INIT_FILE" in self.gem.subkw[i]:
-                        index = self.gem.subkw[i].index("GEM_INIT_FILE")
-                        ext_name = self.gem.cont[i][index][0][0]
-                        ext_file = GEMinit(
-                            lst_name=ext_name, task_root=self.task_root
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.gem_init.append(dcp(ext_file))
+            if ".gem" in read_ext:
+                ext_names = []
+                for subkw, cont in zip(self.gem.subkw, self.gem.cont):
+                    index = sub_key_index(subkw)
+                    if "GEM_INIT_FILE" in index:
+                        ext_names.append(cont[index["GEM_INIT_FILE"]][0][0])
+                self.gem_init.extend(pool.map(load_gem_init, ext_names))
 
             # append RESART defnitions
-            if ext == ".ic":
-                for i in range(len(self.ic.mainkw)):
-                    if "DIS_TYPE" in self.ic.subkw[i]:
-                        index = self.ic.subkw[i].index("DIS_TYPE")
-                        if self.ic.cont[i][index][0][0] != "RESTART":
-                            continue
-                        ext_name = self.ic.cont[i][index][0][1]
-                        raw_name = os.path.basename(ext_name)
-                        f_name, f_ext = os.path.splitext(raw_name)
-                        ext_file = RFR(
-                            name=f_name,
-                            file_ext=f_ext,
-                            task_root=self.task_root,
-                        )
-                        path = os.path.join(task_root, ext_name)
-                        ext_file.read_file(path, encoding=encoding)
-                        self.rfr.append(dcp(ext_file))
+            if ".ic" in read_ext:
+                ext_names = []
+                for subkw, cont in zip(self.ic.subkw, self.ic.cont):
+                    index = sub_key_index(subkw)
+                    if "DIS_TYPE" in index:
+                        dis_type = cont[index["DIS_TYPE"]][0]
+                        if dis_type[0] == "RESTART":
+                            ext_names.append(dis_type[1])
+                self.rfr.extend(
+                    pool.map(
+                        lambda ext_name: load_ext(RFR, ext_name), ext_names
+                    )
+                )
 
             # read phreeqc.dat
-            if ext == ".pqc":  # phreeqc.dat or Phreeqc.dat
-                pqcfiles = glob.glob(os.path.join(task_root, "*hreeqc.dat"))
-                self.pqcdat.read_file(
-                    path=pqcfiles[0], encoding=encoding, verbose=verbose
+            if ".pqc" in read_ext:  # phreeqc.dat or Phreeqc.dat
+                pqc_path = next(
+                    (
+                        path
+                        for fname, path in found_files.items()
+                        if fname.endswith("hreeqc.dat")
+                    ),
+                    None,
                 )
+                if pqc_path is not None:
+                    self.pqcdat.read_file(
+                        path=pqc_path, encoding=encoding, verbose=verbose
+                    )
+                elif verbose:
+                    print("ogs5py.OGS.load_model - no phreeqc.dat found")
 
         # load ASC files
-        files = glob.glob(os.path.join(task_root, task_id + "*.asc"))
-        for fil in files:
-            raw_name = os.path.basename(fil)
-            f_name, f_ext = os.path.splitext(raw_name)
+        for fname, path in found_files.items():
+            if not (fname.startswith(task_id) and fname.endswith(".asc")):
+                continue
+            f_name = os.path.splitext(fname)[0]
             ext_file = ASC(
-                name=self.task_id + f_name[len(task_id) :],
-                task_root=self.task_root,
+                name=self._task_id + f_name[len(task_id) :],
+                task_root=self._task_root,
             )
-            path = os.path.join(task_root, fil)
             ext_file.read_file(path, encoding=encoding)
-            self.asc.append(dcp(ext_file))
+            self.asc.append(ext_file)
 
         return True
 
-    def readvtk(self, pcs="ALL", output_dir=None):
+    @staticmethod
+    def _ext_path(ext_root, ext_name):
+        """Path of an external file referenced in the model."""
+        if os.path.isabs(ext_name):
+            return ext_name
+        return ext_root + ext_name
+
+    def _load_ext(self, base, ext_name, ext_root, encoding, **kw):
+        """
+        Read an external file of the model.
+
+        The base is either a file class or a prototype instance,
+        that is shallow copied instead of constructing a new file.
+        """
+        raw_name = os.path.basename(ext_name)
+        f_name, f_ext = os.path.splitext(raw_name)
+        if isinstance(base, type):
+            ext_file = base(
+                name=f_name, file_ext=f_ext, task_root=self._task_root, **kw
+            )
+        else:
+            ext_file = copy(base)
+            ext_file.name = f_name
+            ext_file.file_ext = f_ext
+        ext_file.read_file(
+            self._ext_path(ext_root, ext_name), encoding=encoding
+        )
+        return ext_file
+
+    def readvtk(
+        self,
+        pcs="ALL",
+        output_dir=None,
+        n_jobs=1,
+        stack=False,
+        dtype=None,
+        cache=False,
+    ):
         r"""
         Reader for vtk outputfiles of this OGS5 model.
 
@@ -825,6 +1032,23 @@ class OGS:
             Sometimes OGS5 doesn't put the output in the right directory.
             You can specify a separate output directory here in this case.
             Default: :any:'None'
+        n_jobs : :class:'int' or :any:'None', optional
+            Number of processes to read the output files in parallel.
+            If :any:'None', all CPUs are used. Default: 1
+        stack : :class:'bool', optional
+            If True, "DATA" is a single dict, where the point, cell and field
+            data of all time steps is stacked with the time as first axis.
+            All other entries (like the points and cells) are taken from the
+            first time step. Default: False
+        dtype : numpy dtype or :any:'None', optional
+            If given, the floating point arrays of the point and cell data
+            are cast to this dtype on reading (e.g. "float32" to halve the
+            memory). Note, that casting to a lower precision is lossy.
+            Default: :any:'None'
+        cache : :class:'bool', optional
+            If True, the result is cached and reused by later calls with
+            cache=True, as long as the read files are unchanged.
+            See :any:`ogs5py.reader.clear_cache`. Default: False
 
         Returns
         -------
@@ -840,10 +1064,20 @@ class OGS:
         elif self.has_output_dir:
             root = self.output_dir
         else:
-            root = self.task_root
-        return read(task_root=root, task_id=self.task_id, pcs=pcs)
+            root = self._task_root
+        return read(
+            task_root=root,
+            task_id=self._task_id,
+            pcs=pcs,
+            n_jobs=n_jobs,
+            stack=stack,
+            dtype=dtype,
+            cache=cache,
+        )
 
-    def readpvd(self, pcs="ALL", output_dir=None):
+    def readpvd(
+        self, pcs="ALL", output_dir=None, n_jobs=1, dtype=None, cache=False
+    ):
         r"""
         Read the paraview pvd files of this OGS5 model.
 
@@ -876,6 +1110,18 @@ class OGS:
             Sometimes OGS5 doesn't put the output in the right directory.
             You can specify a separate output directory here in this case.
             Default: :any:'None'
+        n_jobs : :class:'int' or :any:'None', optional
+            Number of processes to read the output files in parallel.
+            If :any:'None', all CPUs are used. Default: 1
+        dtype : numpy dtype or :any:'None', optional
+            If given, the floating point arrays of the point and cell data
+            are cast to this dtype on reading (e.g. "float32" to halve the
+            memory). Note, that casting to a lower precision is lossy.
+            Default: :any:'None'
+        cache : :class:'bool', optional
+            If True, the result is cached and reused by later calls with
+            cache=True, as long as the read files are unchanged.
+            See :any:`ogs5py.reader.clear_cache`. Default: False
 
         Returns
         -------
@@ -891,10 +1137,17 @@ class OGS:
         elif self.has_output_dir:
             root = self.output_dir
         else:
-            root = self.task_root
-        return read(task_root=root, task_id=self.task_id, pcs=pcs)
+            root = self._task_root
+        return read(
+            task_root=root,
+            task_id=self._task_id,
+            pcs=pcs,
+            n_jobs=n_jobs,
+            dtype=dtype,
+            cache=cache,
+        )
 
-    def readtec_point(self, pcs="ALL", output_dir=None):
+    def readtec_point(self, pcs="ALL", output_dir=None, n_jobs=1, cache=False):
         r"""
         Collect TECPLOT point output from this OGS5 model.
 
@@ -925,6 +1178,13 @@ class OGS:
             Sometimes OGS5 doesn't put the output in the right directory.
             You can specify a separate output directory here in this case.
             Default: :any:'None'
+        n_jobs : :class:'int' or :any:'None', optional
+            Number of processes to read the output files in parallel.
+            If :any:'None', all CPUs are used. Default: 1
+        cache : :class:'bool', optional
+            If True, the result is cached and reused by later calls with
+            cache=True, as long as the read files are unchanged.
+            See :any:`ogs5py.reader.clear_cache`. Default: False
 
         Returns
         -------
@@ -940,10 +1200,24 @@ class OGS:
         elif self.has_output_dir:
             root = self.output_dir
         else:
-            root = self.task_root
-        return read(task_root=root, task_id=self.task_id, pcs=pcs)
+            root = self._task_root
+        return read(
+            task_root=root,
+            task_id=self._task_id,
+            pcs=pcs,
+            n_jobs=n_jobs,
+            cache=cache,
+        )
 
-    def readtec_polyline(self, pcs="ALL", trim=True, output_dir=None):
+    def readtec_polyline(
+        self,
+        pcs="ALL",
+        trim=True,
+        output_dir=None,
+        n_jobs=1,
+        as_array=False,
+        cache=False,
+    ):
         r"""
         Collect TECPLOT polyline output from this OGS5 model.
 
@@ -974,12 +1248,25 @@ class OGS:
             Sometimes OGS5 doesn't put the output in the right directory.
             You can specify a separate output directory here in this case.
             Default: :any:'None'
+        n_jobs : :class:'int' or :any:'None', optional
+            Number of processes to read the output files in parallel.
+            If :any:'None', all CPUs are used. Default: 1
         trim : Bool, optional
             if the ply_ids are not continuous, there will be "None" values in
             the output list. If trim is "True" these values will be eliminated.
             If there is just one output for a polyline, the list will
             be eliminated and the output will be the single dict.
             Default : True
+        as_array : Bool, optional
+            If True, the items of each Polyline are given as a single dict,
+            where each variable is stacked into one array with the ply_id
+            as first axis. Missing ply_ids and differing sizes are padded
+            with "NaN" values, so "trim" is not applied.
+            Default : False
+        cache : Bool, optional
+            If True, the result is cached and reused by later calls with
+            cache=True, as long as the read files are unchanged.
+            See :any:`ogs5py.reader.clear_cache`. Default : False
 
         Returns
         -------
@@ -996,8 +1283,16 @@ class OGS:
         elif self.has_output_dir:
             root = self.output_dir
         else:
-            root = self.task_root
-        return read(task_root=root, task_id=self.task_id, pcs=pcs, trim=trim)
+            root = self._task_root
+        return read(
+            task_root=root,
+            task_id=self._task_id,
+            pcs=pcs,
+            trim=trim,
+            n_jobs=n_jobs,
+            as_array=as_array,
+            cache=cache,
+        )
 
     def output_files(self, pcs=None, typ="VTK", element=None, output_dir=None):
         r"""
@@ -1040,8 +1335,8 @@ class OGS:
         elif self.has_output_dir:
             root = self.output_dir
         else:
-            root = self.task_root
-        return read(root, self.task_id, pcs, typ, element)
+            root = self._task_root
+        return read(root, self._task_id, pcs, typ, element)
 
     def run_model(
         self,
@@ -1052,6 +1347,7 @@ class OGS:
         log_path=None,
         log_name=None,
         timeout=None,
+        run_mode="pexpect",
     ):
         """
         Run the defined OGS5 model.
@@ -1081,17 +1377,33 @@ class OGS:
             (task_id+time+"_log.txt")
         timeout : int or None, optional
             Time to wait for OGS5 to finish in seconds. Default: None
+        run_mode : str, optional
+            How ogs is called, when its output is printed:
+
+                - "pexpect": in a pseudo terminal, so the output of ogs
+                  is shown immediately
+                - "subprocess": with a plain pipe, which is cheaper to
+                  start, but ogs may buffer its output
+
+            Without printing, ogs always writes directly to the log.
+            Default: "pexpect"
 
         Returns
         -------
         success : bool
             State if OGS5 terminated 'normally'. (Allways true on Windows.)
         """
+        if run_mode not in ["pexpect", "subprocess"]:
+            raise ValueError(
+                "ogs5py.OGS.run_model - unknown run_mode: " + str(run_mode)
+            )
         # look for the standard ogs executable in the standard-path
         if ogs_exe is None:
-            check_ogs = shutil.which(
-                ogs_name, path=OGS5PY_CONFIG
-            ) or shutil.which(ogs_name)
+            check_ogs = _which_ogs(ogs_name)
+            # redo the lookup if nothing was found or the file was removed
+            if check_ogs is None or not os.path.isfile(check_ogs):
+                _which_ogs.cache_clear()
+                check_ogs = _which_ogs(ogs_name)
             if check_ogs is None:
                 print(
                     "Please put the ogs executable in the default sys path: "
@@ -1106,64 +1418,77 @@ class OGS:
                 return False
             if os.path.islink(ogs_exe):
                 ogs_exe = os.path.realpath(ogs_exe)
-            if os.path.exists(ogs_exe):
-                if not os.path.isfile(ogs_exe):
-                    ogs_exe = os.path.join(ogs_exe, ogs_name)
-            else:
+            # a single stat call to check existence and type
+            try:
+                exe_stat = os.stat(ogs_exe)
+            except OSError:
                 print("The given ogs_exe does not exist...")
                 return False
+            if not stat.S_ISREG(exe_stat.st_mode):
+                ogs_exe = os.path.join(ogs_exe, ogs_name)
         # use absolute path since we change the cwd in the ogs call
         ogs_exe = os.path.abspath(ogs_exe)
 
+        # ogs is called from within the model folder
+        model_root = os.path.abspath(self._task_root)
+
         # create the command to call ogs
-        args = [ogs_exe, self.task_id]
+        args = [ogs_exe, self._task_id]
         # add optional output directory
-        # check if output directory is an absolute path with os.path.isabs
-        # otherwise set it in the task_root directory
+        # (the output_dir setter already made it an absolute path)
         if self.has_output_dir:
-            # format the outputdir
-            output_dir = os.path.normpath(self.output_dir)
-            # check if outputdir is given as absolut path
-            if not os.path.isabs(output_dir):
-                # if not, put the outputfolder in the task_root
-                output_dir = os.path.join(
-                    os.path.abspath(self.task_root), output_dir
-                )
+            output_dir = self.output_dir
             # create the outputdir
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+            os.makedirs(output_dir, exist_ok=True)
             # append the outputdir to the ogs-command
             args.append("--output-directory")
             args.append(output_dir)
         else:
-            output_dir = os.path.abspath(self.task_root)
-
-        # prevent eraising files...
-        if not save_log:
-            log_name = None
-
-        # set standard log_name
-        if log_name is None:
-            log_name = (
-                self.task_id
-                + "_"
-                + time.strftime("%Y-%m-%d_%H-%M-%S")
-                + "_log.txt"
-            )
-        # put the logfile in the defined output-dir
-        if log_path is None:
-            log_path = output_dir
-        log = os.path.join(log_path, log_name)
+            output_dir = model_root
+
+        # only create a log file if it should be saved
+        log = None
+        if save_log:
+            # set standard log_name
+            if log_name is None:
+                log_name = (
+                    self._task_id
+                    + "_"
+                    + time.strftime("%Y-%m-%d_%H-%M-%S")
+                    + "_log.txt"
+                )
+            # put the logfile in the defined output-dir
+            if log_path is None:
+                log_path = output_dir
+            log = os.path.join(log_path, log_name)
+
+        if not print_log:
+            # without printing, ogs can write directly to the log file
+            self.exitstatus = _run_silent(args, log, model_root, timeout)
+            return self.exitstatus == 0
 
         # create a splitted output stream (to file and stdout)
         out = Output(log, print_log=print_log)
-        # call ogs with pexpect
+        if run_mode == "subprocess":
+            try:
+                self.exitstatus = _run_piped(args, out, model_root, timeout)
+            finally:
+                out.close()
+            return self.exitstatus == 0
+        # call ogs with pexpect (reading the output in larger chunks)
+        # pass the arguments directly, so paths with spaces are kept intact
+        if sys.platform == "win32":
+            cmd, cmd_kw = args, {}
+        else:
+            cmd, cmd_kw = args[0], {"args": args[1:]}
         child = CmdRun(
-            " ".join(args),
+            cmd,
             timeout=timeout,
+            maxread=io.DEFAULT_BUFFER_SIZE,
             logfile=out,
             encoding=out.encoding,
-            cwd=os.path.abspath(self.task_root),
+            cwd=model_root,
+            **cmd_kw,
         )
         # wait for ogs to finish
         child.expect(pexpect.EOF)
@@ -1176,7 +1501,4 @@ class OGS:
         # close the output stream
         out.close()
 
-        if not save_log:
-            os.remove(log)
-
         return success
@@ -14,12 +14,17 @@ Reader
    readpvd
    readtec_point
    readtec_polyline
+   clear_cache
    VTK_ERR
 
+When called with ``cache=True``, the readers cache the latest results and
+reuse them as long as the read files are unchanged.
+
 ----
 """
 from ogs5py.reader.reader import (
     VTK_ERR,
+    clear_cache,
     readpvd,
     readtec_point,
     readtec_polyline,
@@ -31,5 +36,6 @@ __all__ = [
     "readpvd",
     "readtec_point",
     "readtec_polyline",
+    "clear_cache",
     "VTK_ERR",
 ]
@@ -2,8 +2,13 @@
 """Reader for the OGS5 Output."""
 
 
-import glob
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
 
 import numpy as np
 from vtk import (
@@ -15,9 +20,8 @@ from vtk import (
 
 from ogs5py.reader.techelper import readtec_multi_table, readtec_single_table
 from ogs5py.reader.vtkhelper import XMLreader_dict, vtkreader_dict
-from ogs5py.tools.output import readpvd_single, split_ply_path, split_pnt_path
-from ogs5py.tools.tools import split_file_path
-from ogs5py.tools.types import PCS_TYP
+from ogs5py.tools.output import _readpvd_times_files
+from ogs5py.tools.types import PCS_BY_EXT, PCS_EXT, PCS_TYP
 
 # redirect VTK error to a string
 VTK_ERR = vtkStringOutputWindow()
@@ -26,14 +30,205 @@ VTK_ERR = vtkStringOutputWindow()
 VTK_STD_OUT = vtkOutputWindow()
 VTK_STD_OUT.SetInstance(VTK_ERR)
 
+# cache for the latest read results (keyed by the state of the read files)
+# (only used if the readers are called with cache=True)
+_READ_CACHE = OrderedDict()
+_READ_CACHE_SIZE = 8
+_READ_CACHE_LOCK = threading.Lock()
+# read ahead hints for the serial readers (not available on all systems)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# vtk reader objects are reused for all read files (per thread)
+_VTK_READERS = threading.local()
+
+# vtk output name after the task_id: "[_{PCS}]{step}.vtk" or
+# "_RWPT_{step}.particles.vtk" (random walk particles)
+_VTK_NAME_RE = re.compile(
+    r"(?:(_RWPT)_(\d+)\.particles|(_[A-Z_]+)?(\d{4,}))\.vtk$"
+)
+
+# tecplot output names after the task_id: "_time_{pnt}[_{PCS}].tec" and
+# "_ply_{line}_t{step}[_{PCS}].tec"
+_PNT_NAME_RE = re.compile(r"_time_(.*)\.tec$")
+_PLY_NAME_RE = re.compile(r"_ply_(.+?)_t(\d+)(?:[\._](.*))?\.tec$")
+
+# patterns to determine the vtk file type from the start of the file
+_XML_TYPE_RE = re.compile(rb'<VTKFile[^>]*?\stype="(\w+)"')
+_DATASET_RE = re.compile(rb"^\s*DATASET\s+(\w+)", re.M)
+
+
+def _scan_dir(task_root):
+    """Directory entries in task_root by name (a single directory scan)."""
+    try:
+        with os.scandir(task_root) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _group_vtk_files(found, task_id):
+    """Group the vtk output entries by PCS type, sorted by the step number."""
+    names, steps = {}, {}
+    for name in sorted(found):
+        if not name.startswith(task_id):
+            continue
+        match = _VTK_NAME_RE.match(name, len(task_id))
+        if match is None:
+            continue
+        rwpt, rwpt_step, ext, step = match.groups(default="")
+        # random walk output is only given as particle files
+        if rwpt:
+            ext, step = rwpt, rwpt_step
+        elif ext == "_RANDOM_WALK":
+            continue
+        pcs = PCS_BY_EXT.get(ext)
+        if pcs is None:
+            continue
+        names.setdefault(pcs, []).append(name)
+        steps.setdefault(pcs, []).append(int(step))
+    grouped = {}
+    for pcs in names:
+        order = np.argsort(np.array(steps[pcs], dtype=int), kind="stable")
+        grouped[pcs] = [found[names[pcs][i]] for i in order]
+    return grouped
+
+
+def _cache_key(typ, infiles, *args):
+    """Cache key from the reader type and the path, mtime and size of files."""
+    sig = []
+    for infile in infiles:
+        try:
+            # directory entries already hold the stat info from the scan
+            if isinstance(infile, os.DirEntry):
+                stat = infile.stat()
+            else:
+                stat = os.stat(infile)
+        except OSError:
+            return None
+        sig.append((os.fspath(infile), stat.st_mtime_ns, stat.st_size))
+    return (typ, tuple(sig)) + args
+
+
+def _cache_get(key):
+    """Get an independent copy of a cached read result or None."""
+    if key is None:
+        return None
+    with _READ_CACHE_LOCK:
+        try:
+            output = _READ_CACHE[key]
+        except KeyError:
+            return None
+        _READ_CACHE.move_to_end(key)
+    # cached results are never changed, so they can be copied without lock
+    return deepcopy(output)
+
+
+def _cache_put(key, output):
+    """Cache a copy of a read result and drop the least recently used ones."""
+    if key is None:
+        return
+    # store a copy, so changes to the returned output don't affect the cache
+    output = deepcopy(output)
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = output
+        _READ_CACHE.move_to_end(key)
+        while len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+
+
+def clear_cache():
+    """
+    Clear the cache of the output readers.
+
+    The cache is only filled by the readers called with ``cache=True``.
+    """
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def _prefetch(infile):
+    """Advise the OS to read ahead the given file (if supported)."""
+    if not _HAS_FADVISE:
+        return
+    try:
+        fd = os.open(infile, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        # the kernel reads ahead in the background without copying the data
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _file_size(infile):
+    """Size of the given file (0 if it can't be accessed)."""
+    try:
+        return os.stat(infile).st_size
+    except OSError:
+        return 0
+
+
+def _read_files(read_single, infiles, n_jobs=1):
+    """Read all files with the given reader (in parallel for n_jobs > 1)."""
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(infiles))
+    if n_jobs <= 1:
+        output = []
+        for i, infile in enumerate(infiles):
+            # let the OS load the next file while parsing the current one
+            if i + 1 < len(infiles):
+                _prefetch(infiles[i + 1])
+            output.append(read_single(infile))
+        return output
+    # submit the largest files first to keep the workers evenly loaded
+    order = np.argsort([_file_size(infile) for infile in infiles])[::-1]
+    chunksize = max(1, len(infiles) // (4 * n_jobs))
+    output = len(infiles) * [None]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        results = pool.map(
+            read_single, [infiles[i] for i in order], chunksize=chunksize
+        )
+        for i, result in zip(order, results):
+            output[i] = result
+    return output
+
 
 ###############################################################################
 # vtk readers
 ###############################################################################
 
 
-def readvtk_single(infile):
-    """Read an arbitrary vtk/vtkXML file to a dictionary wtih its data."""
+def _sniff_reader(infile):
+    """Get the reader from the start of a vtk/vtkXML file (None if unsure)."""
+    try:
+        with open(infile, "rb") as fin:
+            head = fin.read(1024)
+    except OSError:
+        return None
+    if head.startswith(b"# vtk DataFile"):
+        # the dataset type follows the header line and the file format
+        match = _DATASET_RE.search(head, head.find(b"\n") + 1)
+        datasettype = match.group(1).decode().lower() if match else None
+        if datasettype in vtkreader_dict:
+            return vtkreader_dict[datasettype], False
+        return None
+    match = _XML_TYPE_RE.search(head)
+    if match and match.group(1).decode() in XMLreader_dict:
+        return XMLreader_dict[match.group(1).decode()], True
+    return None
+
+
+def _detect_reader(infile):
+    """Get the reader for a vtk/vtkXML file and whether it is XML."""
+    detected = _sniff_reader(infile)
+    if detected is not None:
+        return detected
+    # let vtk check the file, if the file type is not obvious
     xml_checker = vtkXMLFileReadTester()
     xml_checker.SetFileName(infile)
     is_xml = bool(xml_checker.TestReadFile())
@@ -48,7 +243,7 @@ def readvtk_single(infile):
             )
             if xml_type == "Collection":
                 print("...try the 'readpvd' function")
-            return {}
+            return None
     else:
         # check for vtk-type
         checker = vtkDataReader()
@@ -63,21 +258,57 @@ def readvtk_single(infile):
         if not reader_found:
             print(infile + ": vtk file not valid")
             checker.CloseVTKFile()
-            return {}
+            return None
         checker.CloseVTKFile()
+    return reader, is_xml
+
+
+def _get_vtk_reader(reader_cls, is_xml):
+    """Reusable vtk reader object of the given class (one per thread)."""
+    readers = _VTK_READERS.__dict__.setdefault("readers", {})
+    if reader_cls not in readers:
+        vtk_reader = reader_cls()
+        if not is_xml:
+            # https://stackoverflow.com/a/35018175/6696397
+            vtk_reader.ReadAllScalarsOn()
+            vtk_reader.ReadAllVectorsOn()
+            vtk_reader.ReadAllNormalsOn()
+            vtk_reader.ReadAllTensorsOn()
+            vtk_reader.ReadAllColorScalarsOn()
+            vtk_reader.ReadAllTCoordsOn()
+            vtk_reader.ReadAllFieldsOn()
+        readers[reader_cls] = vtk_reader
+    return readers[reader_cls]
+
+
+def _cast_arrays(data, dtype):
+    """Cast floating point arrays (or dicts of them) to the given dtype."""
+    if isinstance(data, dict):
+        return {key: _cast_arrays(val, dtype) for key, val in data.items()}
+    if np.issubdtype(data.dtype, np.floating):
+        return data.astype(dtype, copy=False)
+    return data
+
+
+def readvtk_single(infile, detected=None, dtype=None):
+    """
+    Read an arbitrary vtk/vtkXML file to a dictionary wtih its data.
+
+    The file type is probed, unless ``detected`` already gives the
+    ``(reader, is_xml)`` pair for it (e.g. from the first file of a series).
+    If ``dtype`` is given, float arrays in point and cell data are cast to it.
+    """
+    if detected is None:
+        detected = _detect_reader(infile)
+        if detected is None:
+            return {}
+    reader, is_xml = detected
 
     # read in the vtk object
-    vtk_reader = reader[0]()
+    vtk_reader = _get_vtk_reader(reader[0], is_xml)
     vtk_reader.SetFileName(infile)
-    if not is_xml:
-        # https://stackoverflow.com/a/35018175/6696397
-        vtk_reader.ReadAllScalarsOn()
-        vtk_reader.ReadAllVectorsOn()
-        vtk_reader.ReadAllNormalsOn()
-        vtk_reader.ReadAllTensorsOn()
-        vtk_reader.ReadAllColorScalarsOn()
-        vtk_reader.ReadAllTCoordsOn()
-        vtk_reader.ReadAllFieldsOn()
+    # force a new read, even if the file name didn't change
+    vtk_reader.Modified()
     vtk_reader.Update()
     file_obj = vtk_reader.GetOutput()
 
@@ -87,11 +318,45 @@ def readvtk_single(infile):
         output["header"] = vtk_reader.GetHeader()
     else:
         output["header"] = "vtk-XML file"
+    if dtype is not None:
+        for key in ["point_data", "cell_data"]:
+            if key in output:
+                output[key] = _cast_arrays(output[key], dtype)
 
     return output
 
 
-def readvtk(task_root=".", task_id=None, pcs="ALL", single_file=None):
+def _read_header_time(infile):
+    """TIME given in the header of a legacy vtk file (None if not given)."""
+    try:
+        with open(infile, "rb") as fin:
+            fin.readline()
+            header = fin.readline().decode(errors="replace").strip()
+    except OSError:
+        return None
+    if "=" not in header:
+        return None
+    return float(header.split("=")[1])
+
+
+def _series_reader(first_file, dtype=None):
+    """Single file reader for a series, probing the type only once."""
+    detected = _detect_reader(first_file)
+    if detected is None:
+        return partial(readvtk_single, dtype=dtype)
+    return partial(readvtk_single, detected=detected, dtype=dtype)
+
+
+def readvtk(
+    task_root=".",
+    task_id=None,
+    pcs="ALL",
+    single_file=None,
+    n_jobs=1,
+    stack=False,
+    dtype=None,
+    cache=False,
+):
     r"""
     A genearal reader for OGS vtk outputfiles.
 
@@ -134,6 +399,26 @@ def readvtk(task_root=".", task_id=None, pcs="ALL", single_file=None):
     single_file : string or None, optional
         If you want to read just a single file, you can set the path here.
         Default : None
+    n_jobs : int or None, optional
+        Number of processes to read the files in parallel.
+        If None, all CPUs are used. Default : 1
+    stack : Bool, optional
+        If True, "DATA" is a single dict, where the point, cell and field
+        data of all time steps is stacked with the time as first axis.
+        All other entries (like the points and cells) are taken from the
+        first time step. The data names and shapes need to be constant.
+        Default : False
+    dtype : numpy dtype or None, optional
+        If given, the floating point arrays of the point and cell data
+        are cast to this dtype on reading (e.g. "float32" to halve the
+        memory). Note, that casting to a lower precision is lossy.
+        Default : None
+    cache : Bool, optional
+        If True, the result is cached and reused by later calls with
+        cache=True, as long as the read files are unchanged. The results
+        are independent copies. Use :any:`clear_cache` to free the memory.
+        Default : False
+
     Returns
     -------
     result : dict
@@ -143,56 +428,115 @@ def readvtk(task_root=".", task_id=None, pcs="ALL", single_file=None):
     """
     # for a single file return the output immediately
     if single_file is not None:
-        return readvtk_single(single_file)
+        return readvtk_single(single_file, dtype=dtype)
     if pcs is None:
         pcs = ""
+    # scan the output folder once and sort the files by their PCS type
+    # (input files are sorted by the step number in their names)
+    by_pcs = _group_vtk_files(_scan_dir(os.path.normpath(task_root)), task_id)
     # if pcs is "ALL" iterate over all known PCS types
     if pcs == "ALL":
         out = {}
         for pcs_single in PCS_TYP:
-            out_single = readvtk(task_root, task_id, pcs_single)
+            out_single = _readvtk_pcs(
+                by_pcs.get(pcs_single, []),
+                pcs_single,
+                stack,
+                dtype,
+                n_jobs,
+                cache,
+            )
             if out_single:
                 out[pcs_single] = out_single
         return out
-    # in the filename, there is a underscore before the PCS-type
-    if pcs != "":
-        pcs = "_" + pcs
-    # YEAHAA.. inconsistency
-    if pcs == "_RANDOM_WALK":
-        pcs = "_RWPT"
-    output = {}
-    # format task_root proper as directory path
-    task_root = os.path.normpath(task_root)
-    # get a list of all output files "{id}0000.vtk" ... "{id}999[...]9.vtk"
-    # if pcs is RWPT the name-sheme is different
-    if pcs == "_RWPT":
-        infiles = glob.glob(
-            os.path.join(task_root, task_id + pcs + "_[0-9]*.particles.vtk")
-        )
+    return _readvtk_pcs(by_pcs.get(pcs, []), pcs, stack, dtype, n_jobs, cache)
+
+
+def _prepare_stack(datas, name, out, jobs):
+    """Collect the arrays in dicts of all time steps to be stacked."""
+    if any(data.keys() != datas[0].keys() for data in datas):
+        raise ValueError("Can't stack changing data names in: " + name)
+    for key in datas[0]:
+        values = [data[key] for data in datas]
+        if isinstance(values[0], dict):
+            out[key] = {}
+            _prepare_stack(values, key, out[key], jobs)
+        elif any(np.shape(val) != np.shape(values[0]) for val in values):
+            raise ValueError("Can't stack changing data shapes of: " + key)
+        else:
+            jobs.append((out, key, datas))
+
+
+def _stack_values(datas, key):
+    """Stack the arrays under key into a preallocated array."""
+    values = [data[key] for data in datas]
+    shape = (len(values),) + np.shape(values[0])
+    out = np.empty(shape, dtype=np.result_type(*values))
+    del values
+    for i, data in enumerate(datas):
+        # release the read array right after copying it
+        out[i] = data.pop(key)
+    return out
+
+
+def _stack_series(data):
+    """Stack the point, cell and field data of all time steps."""
+    output = dict(data[0])
+    jobs = []
+    for key in ["point_data", "cell_data", "field_data"]:
+        if key in output:
+            output[key] = {}
+            _prepare_stack(
+                [data_i[key] for data_i in data], key, output[key], jobs
+            )
+    # stack the largest arrays first in threads (numpy releases the GIL)
+    jobs.sort(key=lambda job: np.size(job[2][0][job[1]]), reverse=True)
+    n_workers = min(len(jobs), os.cpu_count() or 1)
+    if n_workers <= 1:
+        stacked = [_stack_values(datas, key) for _, key, datas in jobs]
     else:
-        infiles = glob.glob(
-            os.path.join(
-                task_root, task_id + pcs + "[0-9][0-9][0-9]*[0-9].vtk"
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            stacked = list(
+                pool.map(
+                    _stack_values,
+                    [job[2] for job in jobs],
+                    [job[1] for job in jobs],
+                )
             )
-        )
+    for (out, key, _), arr in zip(jobs, stacked):
+        out[key] = arr
+    return output
 
-    # sort input files by name, since they are sorted by timesteps
-    infiles.sort()
+
+def _readvtk_pcs(entries, pcs, stack, dtype, n_jobs, cache=False):
+    """Read the vtk output files of a single PCS type."""
+    output = {}
+    infiles = [entry.path for entry in entries]
     # iterate over all input files
     time = []
     data = []
     if not infiles:
         return output
-    for infile in infiles:
-        # read the single vtk-file
-        out = readvtk_single(infile)
-        # in the RWPT files the TIME is not given as field_data but in header
-        if pcs == "_RWPT" and "header" in out:
-            if out["header"] and "=" in out["header"]:
-                # ndmin = 1 to match the standard format
-                out["field_data"]["TIME"] = np.array(
-                    float(out["header"].split("=")[1]), ndmin=1
-                )
+    # return the cached output, if the files didn't change
+    key = _cache_key("vtk", entries, pcs, stack, dtype) if cache else None
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # in the RWPT files the TIME is not given as field_data but in header
+    # (only read the headers to sort the files before parsing them)
+    head_time = len(infiles) * [None]
+    if pcs == "RANDOM_WALK":
+        head_time = [_read_header_time(infile) for infile in infiles]
+        if None not in head_time:
+            head_sort = np.argsort(head_time, kind="stable")
+            infiles = [infiles[i] for i in head_sort]
+            head_time = [head_time[i] for i in head_sort]
+    # read the single vtk-files (all files of a series have the same type)
+    outs = _read_files(_series_reader(infiles[0], dtype), infiles, n_jobs)
+    for infile, out, time_i in zip(infiles, outs, head_time):
+        if time_i is not None and "field_data" in out:
+            # ndmin = 1 to match the standard format
+            out["field_data"]["TIME"] = np.array(time_i, ndmin=1)
         if "field_data" in out and "TIME" in out["field_data"]:
             time.append(out["field_data"]["TIME"])
             data.append(out)
@@ -200,16 +544,15 @@ def readvtk(task_root=".", task_id=None, pcs="ALL", single_file=None):
             raise ValueError("vtk file not valid: " + infile)
 
     # sort the time-steps
-    time = np.squeeze(time)
-    time_sort = np.argsort(time)
-    time = time[time_sort]
-    data_sort = []
-    for new_pos in time_sort:
-        data_sort.append(data[new_pos])
+    time = np.concatenate(time).ravel()
+    time_sort = np.argsort(time, kind="stable")
 
     # sort output by timesteps
-    output["TIME"] = time
-    output["DATA"] = data_sort
+    output["TIME"] = time[time_sort]
+    output["DATA"] = [data[i] for i in time_sort.tolist()]
+    if stack:
+        output["DATA"] = _stack_series(output["DATA"])
+    _cache_put(key, output)
 
     return output
 
@@ -219,7 +562,15 @@ def readvtk(task_root=".", task_id=None, pcs="ALL", single_file=None):
 ###############################################################################
 
 
-def readpvd(task_root=".", task_id=None, pcs="ALL", single_file=None):
+def readpvd(
+    task_root=".",
+    task_id=None,
+    pcs="ALL",
+    single_file=None,
+    n_jobs=1,
+    dtype=None,
+    cache=False,
+):
     r"""
     Read a paraview pvd file.
 
@@ -262,6 +613,20 @@ def readpvd(task_root=".", task_id=None, pcs="ALL", single_file=None):
     single_file : string or None, optional
         If you want to read just a single file, you can set the path here.
         Default : None
+    n_jobs : int or None, optional
+        Number of processes to read the files in parallel.
+        If None, all CPUs are used. Default : 1
+    dtype : numpy dtype or None, optional
+        If given, the floating point arrays of the point and cell data
+        are cast to this dtype on reading (e.g. "float32" to halve the
+        memory). Note, that casting to a lower precision is lossy.
+        Default : None
+    cache : Bool, optional
+        If True, the result is cached and reused by later calls with
+        cache=True, as long as the read files are unchanged. The results
+        are independent copies. Use :any:`clear_cache` to free the memory.
+        Default : False
+
     Returns
     -------
     result : dict
@@ -278,14 +643,27 @@ def readpvd(task_root=".", task_id=None, pcs="ALL", single_file=None):
         task_root, task_id = os.path.split(root)
         if task_root == "":
             task_root = "."
-        return readpvd(task_root, task_id, pcs="")
+        return readpvd(
+            task_root, task_id, "", n_jobs=n_jobs, dtype=dtype, cache=cache
+        )
     if pcs is None:
         pcs = ""
     # if pcs is "ALL" iterate over all known PCS types
     if pcs == "ALL":
+        # find the present pvd files of all PCS types with a single scan
+        found = _scan_dir(os.path.normpath(task_root))
         out = {}
-        for pcs_single in PCS_TYP:
-            out_single = readpvd(task_root, task_id, pcs_single)
+        for pcs_single, pcs_ext in zip(PCS_TYP, PCS_EXT):
+            if task_id + pcs_ext + ".pvd" not in found:
+                continue
+            out_single = readpvd(
+                task_root,
+                task_id,
+                pcs_single,
+                n_jobs=n_jobs,
+                dtype=dtype,
+                cache=cache,
+            )
             if out_single != {}:
                 out[pcs_single] = out_single
         return out
@@ -297,33 +675,40 @@ def readpvd(task_root=".", task_id=None, pcs="ALL", single_file=None):
     task_root = os.path.normpath(task_root)
     infile = os.path.join(task_root, task_id + pcs + ".pvd")
     # get the pvd information about the concerned files
-    pvd_info = readpvd_single(infile)
+    # (only the time steps and file names are needed)
+    pvd_info = _readpvd_times_files(infile)
     # if pvd is empty: return
-    if not pvd_info:
+    if pvd_info is None:
         return output
-    # initialize output-time
-    time = []
-    for info in pvd_info["infos"]:
-        time.append(info["timestep"])
-    time = np.array(time)
-    time_sort = np.argsort(time)
-    time = time[time_sort]
-    files = []
-    for new_pos in time_sort:
-        files.append(pvd_info["files"][new_pos])
-    data = []
+    # sort the files by time (stable to keep the order of parts)
+    time, pvd_files = pvd_info
+    # the data sets are usually given in order already
+    if np.any(time[1:] < time[:-1]):
+        time_sort = np.argsort(time, kind="stable")
+        time = time[time_sort]
+        pvd_files = [pvd_files[i] for i in time_sort.tolist()]
+    infiles = []
     # iterate over all input files
-    for file_i in files:
+    for file_i in pvd_files:
         # format the file-path
-        if split_file_path(file_i)[0] in ["", "."]:
-            file_i = os.path.join(
-                task_root, "".join(split_file_path(file_i)[1:])
-            )
-        # read the file
-        data.append(readvtk_single(file_i))
+        file_dir, file_base = os.path.split(file_i)
+        if file_dir in ["", "."]:
+            file_i = os.path.join(task_root, file_base)
+        infiles.append(file_i)
+    # return the cached output, if the files didn't change
+    key = _cache_key("pvd", [infile] + infiles, dtype) if cache else None
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # read the files
+    data = []
+    if infiles:
+        reader = _series_reader(infiles[0], dtype)
+        data = _read_files(reader, infiles, n_jobs)
     # append the infos stored in the pvd header
     output["TIME"] = time
     output["DATA"] = data
+    _cache_put(key, output)
 
     return output
 
@@ -333,7 +718,14 @@ def readpvd(task_root=".", task_id=None, pcs="ALL", single_file=None):
 ###############################################################################
 
 
-def readtec_point(task_root=".", task_id=None, pcs="ALL", single_file=None):
+def readtec_point(
+    task_root=".",
+    task_id=None,
+    pcs="ALL",
+    single_file=None,
+    n_jobs=1,
+    cache=False,
+):
     r"""
     Collect TECPLOT point output from OGS5.
 
@@ -375,6 +767,15 @@ def readtec_point(task_root=".", task_id=None, pcs="ALL", single_file=None):
     single_file : string or None, optional
         If you want to read just a single file, you can set the path here.
         Default : None
+    n_jobs : int or None, optional
+        Number of processes to read the files in parallel.
+        If None, all CPUs are used. Default : 1
+    cache : Bool, optional
+        If True, the result is cached and reused by later calls with
+        cache=True, as long as the read files are unchanged. The results
+        are independent copies. Use :any:`clear_cache` to free the memory.
+        Default : False
+
     Returns
     -------
     result : dict
@@ -389,33 +790,72 @@ def readtec_point(task_root=".", task_id=None, pcs="ALL", single_file=None):
     # check PCS
     if pcs is None:
         pcs = ""
+    # find point output by keyword "time" (single scan for all PCS types)
+    found = _scan_dir(os.path.normpath(task_root))
+    # sort the files by the PCS type given in their names in a single pass
+    by_pcs = {}
+    for name in sorted(found):
+        if not name.startswith(task_id):
+            continue
+        match = _PNT_NAME_RE.match(name, len(task_id))
+        if match is None:
+            continue
+        # get the information from the file-name
+        pnt_name, file_pcs = _pnt_name_parts(match.group(1))
+        by_pcs.setdefault(file_pcs, []).append((pnt_name, found[name]))
     # if pcs is "ALL" iterate over all known PCS types
     if pcs == "ALL":
         out = {}
         for pcs_single in PCS_TYP:
-            out_single = readtec_point(task_root, task_id, pcs_single)
+            out_single = _readtec_points(
+                by_pcs.get(pcs_single, []), n_jobs, cache
+            )
             if out_single != {}:
                 out[pcs_single] = out_single
         return out
-    task_root = os.path.normpath(task_root)
-    # find point output by keyword "time"
-    infiles = glob.glob(os.path.join(task_root, task_id + "_time_*." + "tec"))
+    return _readtec_points(by_pcs.get(pcs, []), n_jobs, cache)
 
-    out = {}
-    for infile in infiles:
-        # get the information from the file-name
-        _, pnt_name, file_pcs, _ = split_pnt_path(infile, task_id)
-        # check if the given PCS type matches, else skip the file
-        if file_pcs != pcs:
-            continue
-        # read the file
-        out[pnt_name] = readtec_single_table(infile)
+
+def _pnt_name_parts(name):
+    """Split "{pnt}[_{PCS}]" from a point output file name."""
+    # the point name is at least one leading character without "_"
+    if name[:1] not in ["", "_"]:
+        for pcs in PCS_TYP[1:]:
+            pos = name.rfind("_" + pcs)
+            if pos > 0:
+                return name[:pos], name[pos + 1 :]
+    return name, ""
+
+
+def _readtec_points(pnt_infos, n_jobs, cache=False):
+    """Read the tecplot point output files given by point name and entry."""
+    if not pnt_infos:
+        return {}
+    pnt_names = [pnt_name for pnt_name, _ in pnt_infos]
+    pnt_entries = [entry for _, entry in pnt_infos]
+    pnt_files = [entry.path for entry in pnt_entries]
+    # return the cached output, if the files didn't change
+    key = _cache_key("tec_point", pnt_entries) if cache else None
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # read the files
+    data = _read_files(readtec_single_table, pnt_files, n_jobs)
+    out = dict(zip(pnt_names, data))
+    _cache_put(key, out)
 
     return out
 
 
 def readtec_polyline(
-    task_root=".", task_id=None, pcs="ALL", single_file=None, trim=True
+    task_root=".",
+    task_id=None,
+    pcs="ALL",
+    single_file=None,
+    trim=True,
+    n_jobs=1,
+    as_array=False,
+    cache=False,
 ):
     r"""
     Collect TECPLOT polyline output from OGS5.
@@ -463,6 +903,20 @@ def readtec_polyline(
         If there is just one output for a polyline, the list will be eliminated
         and the output will be the single dict.
         Default : True
+    n_jobs : int or None, optional
+        Number of processes to read the files in parallel.
+        If None, all CPUs are used. Default : 1
+    as_array : Bool, optional
+        If True, the items of each Polyline are not given as list of dicts,
+        but as a single dict, where each variable is stacked into one array
+        with the ply_id as first axis. Missing ply_ids and differing
+        sizes are padded with "NaN" values, so "trim" is not applied.
+        Default : False
+    cache : Bool, optional
+        If True, the result is cached and reused by later calls with
+        cache=True, as long as the read files are unchanged. The results
+        are independent copies. Use :any:`clear_cache` to free the memory.
+        Default : False
 
     Returns
     -------
@@ -477,45 +931,98 @@ def readtec_polyline(
         return readtec_multi_table(single_file)
     if pcs is None:
         pcs = ""
+    # sort the infiles by name to sort it by timestep (pitfall!!!)
+    # (single scan for all PCS types)
+    found = _scan_dir(os.path.normpath(task_root))
+    # sort the files by the PCS type given in their names in a single pass
+    by_pcs = {}
+    for name in sorted(found):
+        if not name.startswith(task_id):
+            continue
+        match = _PLY_NAME_RE.match(name, len(task_id))
+        if match is None:
+            continue
+        # get the information from the file-name
+        line_name, time_step, file_pcs = match.groups(default="")
+        by_pcs.setdefault(file_pcs, []).append(
+            (line_name, int(time_step), found[name])
+        )
     # if pcs is "ALL" iterate over all known PCS types
     if pcs == "ALL":
         out = {}
         for pcs_single in PCS_TYP:
-            out_single = readtec_polyline(task_root, task_id, pcs_single)
+            out_single = _readtec_polylines(
+                by_pcs.get(pcs_single, []), trim, as_array, n_jobs, cache
+            )
             if out_single != {}:
                 out[pcs_single] = out_single
         return out
-    # format the root_path
-    task_root = os.path.normpath(task_root)
-    infiles = glob.glob(
-        os.path.join(task_root, task_id + "_ply_?*_t[0-9]*.tec")
+    return _readtec_polylines(
+        by_pcs.get(pcs, []), trim, as_array, n_jobs, cache
     )
-    # sort the infiles by name to sort it by timestep (pitfall!!!)
-    infiles.sort()
 
+
+def _stack_ply_data(ply_list):
+    """Stack the data of all ply_ids of a polyline in NaN-padded arrays."""
+    present = [ply_data for ply_data in ply_list if ply_data is not None]
+    names = list(dict.fromkeys(name for data in present for name in data))
     out = {}
-    for infile in infiles:
-        # get the information from the file-name
-        _, line_name, time_step, file_pcs, _ = split_ply_path(infile, task_id)
-        # check if the given PCS type matches, else skip the file
-        if file_pcs != pcs:
+    for name in names:
+        values = [
+            np.asarray(data[name], dtype=float)
+            if data is not None and name in data
+            else None
+            for data in ply_list
+        ]
+        shapes = {val.shape for val in values if val is not None}
+        # all ply_ids present with same shape: stack at once
+        if all(val is not None for val in values) and len(shapes) == 1:
+            out[name] = np.stack(values)
             continue
-        # check if the given polyline is already listed
-        if line_name in out:
-            cnt = len(out[line_name])
-            if cnt <= time_step:
-                # if the timesteps are not continous, insert None-values
-                out[line_name] += (1 + time_step - cnt) * [None]
-        else:
-            out[line_name] = (1 + time_step) * [None]
-        # add the actual file-data
-        out[line_name][time_step] = readtec_multi_table(infile)
+        shape = tuple(
+            np.max([val.shape for val in values if val is not None], axis=0)
+        )
+        out[name] = np.full((len(values),) + shape, np.nan)
+        for i, val in enumerate(values):
+            if val is not None:
+                out[name][(i,) + tuple(slice(0, n) for n in val.shape)] = val
+    return out
+
+
+def _readtec_polylines(ply_infos, trim, as_array, n_jobs, cache=False):
+    """Read the tecplot polyline files given by name, time step and entry."""
+    if not ply_infos:
+        return {}
+    ply_entries = [entry for _, _, entry in ply_infos]
+    ply_files = [entry.path for entry in ply_entries]
+    # return the cached output, if the files didn't change
+    key = (
+        _cache_key("tec_polyline", ply_entries, trim, as_array)
+        if cache
+        else None
+    )
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # read the files
+    data = _read_files(readtec_multi_table, ply_files, n_jobs)
 
-    if trim:
-        for line in out:
-            out[line] = [line_i for line_i in out[line] if line_i is not None]
+    # collect the file-data by the time step of each polyline
+    out = {}
+    for (line_name, time_step, _), ply_data in zip(ply_infos, data):
+        out.setdefault(line_name, {})[time_step] = ply_data
+
+    for line, steps in out.items():
+        if trim and not as_array:
+            out[line] = [steps[step] for step in sorted(steps)]
             if len(out[line]) == 1:
                 out[line] = out[line][0]
+            continue
+        # if the timesteps are not continous, insert None-values
+        out[line] = [steps.get(step) for step in range(max(steps) + 1)]
+        if as_array:
+            out[line] = _stack_ply_data(out[line])
+    _cache_put(key, out)
 
     return out
 
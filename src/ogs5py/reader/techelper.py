@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 """Helper functions for the tecplot readers in ogs5py."""
+import mmap
+import re
+
 import numpy as np
 from vtk import (
     vtkPolyDataReader,
@@ -18,6 +21,15 @@ from ogs5py.reader.vtkhelper import (
     _unst_grid_read,
 )
 
+# patterns for the header of tecplot table files
+_TITLE_RE = re.compile(r'^\s*TITLE\s*=\s*"([^"]*)"', re.M)
+_VARS_RE = re.compile(r'^\s*VARIABLES\s*=\s*((?:"[^"]*"[\s,]*)+|.*)', re.M)
+_NAME_RE = re.compile(r'"([^"]*)"')
+_SEP_RE = re.compile(r"[\s,]+")
+# first characters of white space and number lines in tecplot files
+_SPACE = np.frombuffer(b" \t\r\v\f", dtype=np.uint8)
+_NUMBER = np.frombuffer(b"0123456789+-.", dtype=np.uint8)
+
 tecreader_dict = {
     "vtkUnstructuredGrid": (vtkUnstructuredGridReader, _unst_grid_read),
     "vtkStructuredGrid": (vtkStructuredGridReader, _stru_grid_read),
@@ -25,6 +37,21 @@ tecreader_dict = {
     "vtkPolyData": (vtkPolyDataReader, _poly_data_read),
     "vtkRectilinearGrid": (vtkRectilinearGridReader, _rect_grid_read),
 }
+# block readers already resolved for a vtk data set class
+_BLOCK_READERS = {}
+
+
+def _get_block_reader(block):
+    """Get the reader for a vtk data set block (cached by its class)."""
+    block_cls = type(block)
+    if block_cls not in _BLOCK_READERS:
+        block_reader = None
+        for datasettype in tecreader_dict:
+            if block.IsA(datasettype):
+                block_reader = tecreader_dict[datasettype][1]
+                break
+        _BLOCK_READERS[block_cls] = block_reader
+    return _BLOCK_READERS[block_cls]
 
 
 ###############################################################################
@@ -37,6 +64,18 @@ class inspect_tecplot:
 
     def __init__(self, infile, get_zone_sizes=True):
         self.infile = infile
+        # get the zone positions within the file
+        self.start = []
+        self.zone_lines = []
+        self.zone_length = []
+        self.zone_bytes = []
+        self.skip = []
+        if get_zone_sizes:
+            # table files are scanned in a single pass (no vtk parsing)
+            self._scan_zones()
+            self.block_ct = self.zone_ct
+            self.block_names = self.zone_names
+            return
         # get metainfo with vtk
         reader = vtkTecplotReader()
         reader.SetFileName(infile)
@@ -53,31 +92,24 @@ class inspect_tecplot:
         self.block_names = [
             reader.GetBlockName(i).strip() for i in range(self.block_ct)
         ]
-        # get the zone positions within the file
-        self.start = []
-        self.zone_lines = []
-        self.zone_length = []
-        self.skip = []
-        if get_zone_sizes:
-            self._get_zone_ct()
-            self._get_zone_sizes()
 
-    def _get_zone_ct(self):
-        """Get number and names of zones in file."""
-        self.zone_ct = 0
-        self.zone_names = []
-        with open(self.infile, "r") as f:
-            line = f.readline()
-            while line:
-                split = line.split()
-                if split[0] == "ZONE":
-                    self.zone_ct += 1
-                    self.zone_names.append(split[1].split('"')[1])
-                line = f.readline()
-
-    def _get_zone_sizes(self):
+    def _read_header(self, header):
+        """Get title and variable names from the file header."""
+        title = _TITLE_RE.search(header)
+        self.title = title.group(1).strip() if title else ""
+        var_match = _VARS_RE.search(header)
+        if var_match is None:
+            names = []
+        elif '"' in var_match.group(1):
+            names = _NAME_RE.findall(var_match.group(1))
+        else:
+            names = _SEP_RE.split(var_match.group(1).strip())
+        self.var_names = [name.strip() for name in names if name.strip()]
+        self.var_ct = len(self.var_names)
+
+    def _scan_zones(self):
         """
-        Get positions of the zones within the tecplot file.
+        Get header, zones and their positions within the tecplot file.
 
         Only necessary for table/data tecplot files, since they are not
         supported by the vtk-package before version 7.0.
@@ -85,76 +117,88 @@ class inspect_tecplot:
         self.start = []
         self.zone_lines = []
         self.zone_length = []
+        self.zone_bytes = []
 
-        #        if self.zone_ct == 0:
-        #            return
-
-        # workaround for empty zones
-        empty_zone = False
-
-        with open(self.infile, "r") as f:
-            line = f.readline()
-            line_ct = 1
-            for _ in range(self.zone_ct):
-                # print("zone", _)
-                # find the next ZONE
-                while True:
-                    if line.strip().startswith("ZONE"):
-                        line = f.readline()
-                        line_ct += 1
-                        break
-                    line = f.readline()
-                    line_ct += 1
-                # find the start of the data block in this ZONE
-                while line and not line.strip()[0].isdigit():
-                    if line.strip().startswith("ZONE"):
-                        # this means, the zones don't contain data.
-                        empty_zone = True
-                        break
-                        # return [0]*self.zone_ct
-                    line = f.readline()
-                    line_ct += 1
-                if not line:
-                    empty_zone = True
-                self.start.append(line_ct - 1)
-                # count the lines that start with a digit
-                if empty_zone:
-                    self.zone_lines.append(0)
-                    self.zone_length.append(0)
-                else:
-                    self.zone_lines.append(1)
-                    while line and line.strip()[0].isdigit():
-                        line = f.readline()
-                        line_ct += 1
-                        self.zone_lines[-1] += 1
-                    # matrix size is line_ct*name_ct
-                    self.zone_length.append(self.zone_lines[-1] * self.var_ct)
-                empty_zone = False
+        # read the whole file at once and classify the lines by numpy
+        with open(self.infile, "rb") as f:
+            data = f.read()
+        buf = np.frombuffer(data, dtype=np.uint8)
+        starts = np.concatenate(([0], np.flatnonzero(buf == ord("\n")) + 1))
+        starts = starts[starts < len(data)]
+        ends = np.append(starts[1:] - 1, len(data))
+        line_ct = len(starts)
+        # skip leading white spaces to get the first character of each line
+        first_pos = starts.copy()
+        todo = np.arange(line_ct)
+        while todo.size:
+            todo = todo[first_pos[todo] < ends[todo]]
+            todo = todo[np.isin(buf[first_pos[todo]], _SPACE)]
+            first_pos[todo] += 1
+        first = buf[np.minimum(first_pos, max(len(data) - 1, 0))]
+        first[first_pos >= ends] = ord("\n")
+        # data lines start with a number, others are headers or ZONEs
+        is_data = np.isin(first, _NUMBER)
+        data_lines = np.flatnonzero(is_data)
+        other_lines = np.flatnonzero(~is_data)
+        zones = []
+        self.zone_names = []
+        for i in np.flatnonzero(first == ord("Z")):
+            split = data[first_pos[i] : ends[i]].decode().split()
+            if split[0] == "ZONE":
+                zones.append(i)
+                self.zone_names.append(split[1].split('"')[1])
+        self.zone_ct = len(zones)
+        # the header is given before the first ZONE
+        header = data[: starts[zones[0]]] if zones else data
+        self._read_header(header.decode(errors="replace"))
+
+        for i, zone in enumerate(zones):
+            next_zone = zones[i + 1] if i + 1 < len(zones) else line_ct
+            # find the start of the data block in this ZONE
+            pos = np.searchsorted(data_lines, zone)
+            if pos < len(data_lines) and data_lines[pos] < next_zone:
+                start = int(data_lines[pos])
+                # the data block ends at the next non-data line
+                pos = np.searchsorted(other_lines, start)
+                end = (
+                    int(other_lines[pos])
+                    if pos < len(other_lines)
+                    else line_ct
+                )
+                lines = end - start
+                # byte range of the data block within the file
+                self.zone_bytes.append(
+                    (int(starts[start]), int(ends[end - 1]))
+                )
+            else:
+                # workaround for empty zones
+                start, lines = int(next_zone), 0
+                self.zone_bytes.append((0, 0))
+            self.start.append(start)
+            self.zone_lines.append(lines)
+            # matrix size is line_ct*name_ct
+            self.zone_length.append(lines * self.var_ct)
 
         if self.zone_ct > 0:
             # calculate the block-sizes between the data-blocks
             self.skip = [self.start[0]]
             for i in range(1, self.zone_ct):
                 self.skip.append(
-                    self.start[i]
-                    - self.start[i - 1]
-                    - self.zone_lines[i - 1]
-                    + 1
+                    self.start[i] - self.start[i - 1] - self.zone_lines[i - 1]
                 )
 
     def get_zone_table_data(self):
         """Read the zone data by hand from the tecplot table file."""
         zone_data = []
-        # read all zones to numpy arrays
-        with open(self.infile, "r") as f:
-            for i in range(self.zone_ct):
-                # skip header
-                for _ in range(self.skip[i]):
-                    f.readline()
-                # read matrix with np.fromfile (fastest numpy file reader)
-                data = np.fromfile(
-                    f, dtype=float, count=self.zone_length[i], sep=" "
-                )
+        if self.zone_ct == 0:
+            return zone_data
+        # read all zones to numpy arrays from the memory mapped file
+        with open(self.infile, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            for start, end in self.zone_bytes:
+                # the byte range covers exactly the data block of the zone
+                data = np.fromstring(mm[start:end], dtype=float, sep=" ")
                 # reshape matrix acording to the number of variables
                 zone_data.append(data.reshape((-1, self.var_ct)))
 
@@ -172,17 +216,11 @@ class inspect_tecplot:
             # get the i-th block which is an instance of class vtkDataObject
             block = file_blocks.GetBlock(i)
             # read the single block
-            reader_found = False
-            for datasettype in tecreader_dict:
-                if block.IsA(datasettype):
-                    block_reader = tecreader_dict[datasettype][1]
-                    reader_found = True
-                    break
-            if not reader_found:
+            block_reader = _get_block_reader(block)
+            if block_reader is None:
                 print(self.infile + ": file not valid")
                 return {}
-            else:
-                zone_data.append(block_reader(block))
+            zone_data.append(block_reader(block))
 
         return zone_data
 
@@ -214,12 +252,15 @@ def readtec_multi_table(infile):
     time = np.array(
         [float(info.zone_names[i][5:]) for i in range(info.zone_ct)]
     )
+    # stack all zones into one array (variable, zone, row)
+    row_ct = zone_data[0].shape[0] if zone_data else 0
+    stacked = np.empty((info.var_ct, info.zone_ct, row_ct))
+    for n, data in enumerate(zone_data):
+        stacked[:, n, :] = data.T
     # sort values by Variable names
     out = {"TIME": time}
     for i, name in enumerate(info.var_names):
-        out[name] = np.vstack(
-            [zone_data[n][:, i].T for n in range(info.zone_ct)]
-        )
+        out[name] = stacked[i]
 
     return out
 
@@ -29,13 +29,11 @@ def save_vtk_stru_point(path, vtk_dict, verbose=True):
     -----
     All data is assumed to be scalar.
     """
-    from numpy import ascontiguousarray as ascont
     from vtk import (
         vtkFieldData,
         vtkStructuredPoints,
         vtkStructuredPointsWriter,
     )
-    from vtk.util.numpy_support import numpy_to_vtk as np2vtk
 
     out = vtkStructuredPoints()
     if verbose:
@@ -48,41 +46,18 @@ def save_vtk_stru_point(path, vtk_dict, verbose=True):
         if verbose:
             print("Set 'field_data'")
         data = vtkFieldData()
-        for sgl_data in vtk_dict["field_data"]:
-            if verbose:
-                print("  Set '" + sgl_data + "'")
-            arr = np2vtk(
-                ascont(vtk_dict["field_data"][sgl_data].reshape(-1, order="F"))
-            )
-            arr.SetName(sgl_data)
-            data.AddArray(arr)
+        _add_arrays(data, vtk_dict["field_data"], verbose)
         out.SetFieldData(data)
 
     if vtk_dict["point_data"]:
         if verbose:
             print("Set 'point_data'")
-        data = out.GetPointData()
-        for sgl_data in vtk_dict["point_data"]:
-            if verbose:
-                print("  Set '" + sgl_data + "'")
-            arr = np2vtk(
-                ascont(vtk_dict["point_data"][sgl_data].reshape(-1, order="F"))
-            )
-            arr.SetName(sgl_data)
-            data.AddArray(arr)
+        _add_arrays(out.GetPointData(), vtk_dict["point_data"], verbose)
 
     if vtk_dict["cell_data"]:
         if verbose:
             print("Set 'cell_data'")
-        data = out.GetCellData()
-        for sgl_data in vtk_dict["cell_data"]:
-            if verbose:
-                print("  Set '" + sgl_data + "'")
-            arr = np2vtk(
-                ascont(vtk_dict["cell_data"][sgl_data].reshape(-1, order="F"))
-            )
-            arr.SetName(sgl_data)
-            data.AddArray(arr)
+        _add_arrays(out.GetCellData(), vtk_dict["cell_data"], verbose)
 
     writer = vtkStructuredPointsWriter()
     writer.SetFileName(path)
@@ -90,3 +65,17 @@ def save_vtk_stru_point(path, vtk_dict, verbose=True):
     if "header" in vtk_dict:
         writer.SetHeader(vtk_dict["header"])
     writer.Write()
+
+
+def _add_arrays(data, arrays, verbose=True):
+    """Add the given named arrays (flattened in Fortran order) to vtk data."""
+    from numpy import ravel
+    from vtk.util.numpy_support import numpy_to_vtk as np2vtk
+
+    for name, values in arrays.items():
+        if verbose:
+            print("  Set '" + name + "'")
+        # ravel only copies if the array is not already Fortran ordered
+        arr = np2vtk(ravel(values, order="F"))
+        arr.SetName(name)
+        data.AddArray(arr)
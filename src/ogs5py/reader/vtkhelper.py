@@ -14,7 +14,7 @@ from vtk import (
 )
 from vtk.util.numpy_support import vtk_to_numpy as vtk2np
 
-from ogs5py.tools.types import NODE_NO, VTK_TYP
+from ogs5py.tools.types import ELEM_NAMES, NODE_NO, VTK_TYP_LUT
 
 ###############################################################################
 # helper functions
@@ -32,41 +32,39 @@ def _get_data(data):
     return arr_dict
 
 
-def _deflat_data(arr):
-    """Creat list of arrays from flat numpy-data from a vtkObject."""
-    arr_list = []
-    stop_ct = len(arr)
-    i = 0
-    while i < stop_ct:
-        len_i = arr[i]
-        arr_list.append(arr[i + 1 : i + len_i + 1])
-        i += len_i + 1
-    return arr_list
+def _deflat_data(cell_arr):
+    """Creat list of arrays from a vtkCellArray."""
+    offsets = vtk2np(cell_arr.GetOffsetsArray())
+    if len(offsets) < 2:
+        return []
+    conn = np.asarray(vtk2np(cell_arr.GetConnectivityArray()), dtype=int)
+    return np.split(conn, offsets[1:-1])
 
 
 def _get_cells(obj):
     """Extract cells and cell_data from a vtkDataSet and sort it by types."""
     cells, cell_data = {}, {}
     data = _get_data(obj.GetCellData())
-    arr = vtk2np(obj.GetCells().GetData())
-    loc = vtk2np(obj.GetCellLocationsArray())
-    types = vtk2np(obj.GetCellTypesArray())
-
-    for typ in VTK_TYP:
-        if not isinstance(typ, int):
-            continue
-        cell_name = VTK_TYP[typ]
-        n_no = NODE_NO[cell_name]
-        cell_loc_i = np.where(types == typ)[0]
-        loc_i = loc[cell_loc_i]
+    cell_arr = obj.GetCells()
+    offsets = vtk2np(cell_arr.GetOffsetsArray())
+    conn = vtk2np(cell_arr.GetConnectivityArray())
+    # group the cells by element type with a single stable sort
+    elem_ids = VTK_TYP_LUT[vtk2np(obj.GetCellTypesArray())]
+    order = np.argsort(elem_ids, kind="stable")
+    # first position is the count of unknown types (id -1)
+    bounds = np.cumsum(
+        np.bincount(elem_ids + 1, minlength=len(ELEM_NAMES) + 1)
+    )
+
+    for i, cell_name in enumerate(ELEM_NAMES):
+        cell_loc_i = order[bounds[i] : bounds[i + 1]]
         # if there are no cells of the actual type continue
-        if len(loc_i) == 0:
-            # if not loc_i:
+        if len(cell_loc_i) == 0:
             continue
-        arr_i = np.empty((len(loc_i), n_no), dtype=int)
-        for i in range(n_no):
-            arr_i[:, i] = arr[loc_i + i + 1]
-        cells[cell_name] = arr_i
+        n_no = NODE_NO[cell_name]
+        # gather all node ids of this cell type at once
+        node_ids = offsets[cell_loc_i, np.newaxis] + np.arange(n_no)
+        cells[cell_name] = np.asarray(conn[node_ids], dtype=int)
         cell_data_i = {}
         for data_i in data:
             cell_data_i[data_i] = data[data_i][cell_loc_i]
@@ -124,10 +122,10 @@ def _poly_data_read(obj):
     """Reader for vtk polygonal data objects."""
     output = {}
     output["points"] = vtk2np(obj.GetPoints().GetData())
-    output["verts"] = _deflat_data(vtk2np(obj.GetVerts().GetData()))
-    output["lines"] = _deflat_data(vtk2np(obj.GetLines().GetData()))
-    output["polygons"] = _deflat_data(vtk2np(obj.GetPolys().GetData()))
-    output["strips"] = _deflat_data(vtk2np(obj.GetStrips().GetData()))
+    output["verts"] = _deflat_data(obj.GetVerts())
+    output["lines"] = _deflat_data(obj.GetLines())
+    output["polygons"] = _deflat_data(obj.GetPolys())
+    output["strips"] = _deflat_data(obj.GetStrips())
     output["point_data"] = _get_data(obj.GetPointData())
     output["cell_data"] = _get_data(obj.GetCellData())
     output["field_data"] = _get_data(obj.GetFieldData())
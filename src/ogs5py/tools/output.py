@@ -13,21 +13,101 @@ Helpers
    get_output_files
    readpvd_single
    split_ply_path
+   split_ply_paths
    split_pnt_path
+   split_pnt_paths
 """
 import glob
 import os
 import re
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 
 import numpy as np
 
-from ogs5py.tools.types import PCS_TYP
+from ogs5py.tools.types import PCS_EXT, PCS_TYP
+
+# buffer size for bulk reading of (text) output files
+_READ_BUFFER = 1 << 20
+
+# glob patterns for the vtk output files of each PCS type
+# (random walk particles have a different name scheme)
+_VTK_GLOB = {
+    pcs: ext + "[0-9][0-9][0-9]*[0-9].vtk"
+    for pcs, ext in zip(PCS_TYP, PCS_EXT)
+}
+_VTK_GLOB["RANDOM_WALK"] = "_RWPT_[0-9]*.particles.vtk"
 
 ###############################################################################
 # retrieve infos from ogs-filenames
 ###############################################################################
 
+# all PCS types as alternation (longest first to get the full type name)
+_PCS_ALT = "|".join(
+    re.escape(pcs) for pcs in sorted(PCS_TYP[1:], key=len, reverse=True)
+)
+_PCS_START_RE = re.compile("(" + _PCS_ALT + ")")
+
+
+@lru_cache(maxsize=256)
+def _pnt_re(id_name, pnt_name):
+    """Pattern for the start of a point output file with given point."""
+    return re.compile(
+        "^" + re.escape(id_name) + "_time_" + re.escape(pnt_name) + r"+[\._]"
+    )
+
+
+@lru_cache(maxsize=256)
+def _pnt_pcs_re(id_name):
+    """Pattern to search the last PCS type in a point output file name."""
+    return re.compile(
+        "^" + re.escape(id_name) + "_time_[^_]+.*_(" + _PCS_ALT + ")"
+    )
+
+
+@lru_cache(maxsize=256)
+def _pnt_guess_re(id_name):
+    """Pattern to guess the point name (without "_") in a file name."""
+    return re.compile("^" + re.escape(id_name) + r"_time_[^_]+[\._]")
+
+
+@lru_cache(maxsize=256)
+def _pcs_re(pcs, end=False):
+    """Pattern to search "_{pcs}" (at the end) of a tecplot file name."""
+    return re.compile("_" + re.escape(pcs) + (r"\.tec$" if end else ""))
+
+
+def _find_step(name, start=0):
+    """
+    Find the time step token "_t{n}" followed by "." or "_" in a file name.
+
+    Parameters
+    ----------
+    name : str
+        The file name to search in.
+    start : int, optional
+        Position to start the search at. Default: 0
+
+    Returns
+    -------
+    start : int
+        Start of the token ("_t") or -1 if not found.
+    end : int
+        End of the token (after the "." or "_") or -1 if not found.
+    step : int or None
+        The time step number or None if not found.
+    """
+    size = len(name)
+    i = name.find("_t", start)
+    while i != -1:
+        j = i + 2
+        while j < size and name[j].isdigit():
+            j += 1
+        if j > i + 2 and j < size and name[j] in "._":
+            return i, j + 1, int(name[i + 2 : j])
+        i = name.find("_t", i + 1)
+    return -1, -1, None
+
 
 def split_pnt_path(
     infile,
@@ -42,85 +122,80 @@ def split_pnt_path(
 
     {id}_time_{pnt}[_{PCS+extra}].tec
     """
-    # create a workaround for empty PCS string (which is valid)
-    if PCS_name == "":
-        temp_id, temp_pnt, temp_PCS, __ = split_pnt_path(
-            infile=infile,
-            task_id=task_id,
-            pnt_name=None,
-            PCS_name=None,
-            split_extra=False,
-            guess_PCS=False,
+    # remove the directory-part from the filepath to get the basename
+    return _split_pnt_name(
+        os.path.basename(infile),
+        task_id,
+        pnt_name,
+        PCS_name,
+        split_extra,
+        guess_PCS,
+    )
+
+
+def split_pnt_paths(
+    infiles,
+    task_id=None,
+    pnt_name=None,
+    PCS_name=None,
+    split_extra=False,
+    guess_PCS=False,
+):
+    """
+    Retrive ogs-infos from multiple filenames for tecplot-point output.
+
+    Generator yielding the results of :any:`split_pnt_path`
+    for each given file.
+    """
+    basename = os.path.basename
+    for infile in infiles:
+        yield _split_pnt_name(
+            basename(infile),
+            task_id,
+            pnt_name,
+            PCS_name,
+            split_extra,
+            guess_PCS,
         )
-        if temp_id is None:
-            return 4 * (None,)
-        endstring = temp_pnt + temp_PCS
-        PCS = ""
-        if pnt_name is None:
-            if split_extra:
-                # here we have to guess the POINT name and maybe an extra suf
-                # POINT name is guessed as a name without "_"
-                # the rest will be set as extra
-                split_pnt = endstring.find("_")
-                if split_pnt > -1:
-                    pnt = endstring[: endstring.find("_")]
-                    extra = endstring[endstring.find("_") + 1 :]
-                else:
-                    pnt = endstring
-                    extra = ""
-            else:
-                pnt = endstring
-                extra = ""
-        else:
-            if endstring.startswith(pnt_name):
-                pnt = pnt_name
-                extra = endstring[len(pnt) :]
-                if not split_extra and extra != "":
-                    return 4 * (None,)
-        return temp_id, pnt, PCS, extra
 
-    # remove the directory-part from the filepath to get the basename
-    name = os.path.basename(infile)
-    # search for the suffix (aka file ending)
-    suffix_pat = re.compile(r"\.tec$")
-    suffix_match = suffix_pat.search(name)
+
+def _split_pnt_name(name, task_id, pnt_name, PCS_name, split_extra, guess_PCS):
+    """Retrive ogs-infos from the basename of a tecplot-point output."""
+    # create a workaround for empty PCS string (which is valid):
+    # parse without PCS and split the remaining string at the end
+    empty_pcs = PCS_name == ""
+    if empty_pcs:
+        pnt_given, split_given = pnt_name, split_extra
+        pnt_name = PCS_name = None
+        split_extra = guess_PCS = False
+
+    # check for the suffix (aka file ending)
+    if not name.endswith(".tec"):
+        return 4 * (None,)
+    suffix_start = len(name) - 4
     # check for the task_id
     if task_id is None:
-        prefix_pat = re.compile("_time_")
-        prefix_match = prefix_pat.search(name)
-        if prefix_match is None:
+        prefix_start = name.find("_time_")
+        if prefix_start == -1:
             return 4 * (None,)
-        id_name = name[: prefix_match.span()[0]]
+        id_name = name[:prefix_start]
     else:
-        prefix_pat = re.compile("^" + re.escape(task_id) + "_time_")
+        if not name.startswith(task_id + "_time_"):
+            return 4 * (None,)
         id_name = task_id
-    prefix_match = prefix_pat.search(name)
-    if prefix_match is None:
-        return 4 * (None,)
+    prefix_end = len(id_name) + 6
 
     if pnt_name is not None:
-        midtrm_pat = re.compile(
-            "^"
-            + re.escape(id_name)
-            + "_time_"
-            + re.escape(pnt_name)
-            + r"+[\._]"
-        )
-        midtrm_match = midtrm_pat.search(name)
+        midtrm_match = _pnt_re(id_name, pnt_name).search(name)
         if midtrm_match is None:
             return 4 * (None,)
-        PCS = name[midtrm_match.span()[1] : suffix_match.span()[0]]
+        PCS = name[midtrm_match.span()[1] : suffix_start]
         # check PCS
         if PCS_name is None:
-            pcs_found = False
-            for pcs_sgl in PCS_TYP[1:]:
-                if PCS.startswith(pcs_sgl):
-                    pcs_found = True
-                    extra = PCS[len(pcs_sgl) :]
-                    PCS = pcs_sgl
-                    break
-            if not pcs_found:
-                extra = ""
+            pcs_match = _PCS_START_RE.match(PCS)
+            extra = ""
+            if pcs_match is not None:
+                PCS, extra = pcs_match.group(1), PCS[pcs_match.end() :]
         else:
             if PCS.startswith(PCS_name):
                 extra = PCS[len(PCS_name) :]
@@ -132,60 +207,36 @@ def split_pnt_path(
     else:
         # serch for the PCS
         if PCS_name is None:
-            pcs_found = False
-            for pcs_sgl in PCS_TYP[1:]:
-                # create a pattern to search the actual pcs_type
-                midtrm_pat = re.compile(
-                    "^"
-                    + re.escape(id_name)
-                    + "_time_[^_]+.*_"
-                    + re.escape(pcs_sgl)
-                )
-                midtrm_match = midtrm_pat.search(name)
-                # if found retrive the PCS name
-                if midtrm_match is not None:
-                    pcs_found = True
-                    PCS = name[
-                        midtrm_match.span()[1]
-                        - len(pcs_sgl) : suffix_match.span()[0]
-                    ]
-                    # cut off extra suffix from PCS
-                    extra = PCS[len(pcs_sgl) :]
-                    PCS = PCS[: len(pcs_sgl)]
-                    # retrive the pnt name from the file-path
-                    PCS_pat = re.compile(
-                        "_" + re.escape(PCS + extra) + r"\.tec$"
-                    )
-                    PCS_match = PCS_pat.search(name)
-                    pnt = name[prefix_match.span()[1] : PCS_match.span()[0]]
-                    break
-            if not pcs_found:
+            # search for all known PCS types at once
+            midtrm_match = _pnt_pcs_re(id_name).search(name)
+            # if found retrive the PCS name
+            if midtrm_match is not None:
+                PCS = midtrm_match.group(1)
+                # cut off extra suffix from PCS
+                extra = name[midtrm_match.end(1) : suffix_start]
+                # the pnt name is given before "_{PCS}"
+                pnt = name[prefix_end : midtrm_match.start(1) - 1]
+            else:
                 if guess_PCS:
                     # here we have to guess the POINT name and maybe a PCS type
                     # POINT name is guessed as a name without "_"
                     # the rest will be set as PCS
-                    midtrm_pat = re.compile(
-                        "^" + re.escape(id_name) + r"_time_[^_]+[\._]"
-                    )
-                    midtrm_match = midtrm_pat.search(name)
+                    midtrm_match = _pnt_guess_re(id_name).search(name)
                     if midtrm_match is None:
                         return 4 * (None,)
-                    pnt = name[
-                        prefix_match.span()[1] : midtrm_match.span()[1] - 1
-                    ]
-                    PCS = name[midtrm_match.span()[1] : suffix_match.span()[0]]
+                    pnt = name[prefix_end : midtrm_match.span()[1] - 1]
+                    PCS = name[midtrm_match.span()[1] : suffix_start]
                     extra = ""
                 else:
-                    pnt = name[prefix_match.span()[1] : suffix_match.span()[0]]
+                    pnt = name[prefix_end:suffix_start]
                     PCS = ""
                     extra = ""
         else:
-            PCS_pat = re.compile("_" + re.escape(PCS_name))  # +".*\.tec$")
-            PCS_match = PCS_pat.search(name)
+            PCS_match = _pcs_re(PCS_name).search(name)
             if PCS_match is None:
                 return 4 * (None,)
-            pnt = name[prefix_match.span()[1] : PCS_match.span()[0]]
-            extra = name[PCS_match.span()[1] : suffix_match.span()[0]]
+            pnt = name[prefix_end : PCS_match.span()[0]]
+            extra = name[PCS_match.span()[1] : suffix_start]
             # PCS was given, extras should not be split and extra != ""
             # thus we get a contradiction
             if (not split_extra) and extra != "":
@@ -201,6 +252,33 @@ def split_pnt_path(
         # separated by an "_" return None
         return 4 * (None,)
 
+    if not empty_pcs:
+        return id_name, pnt, PCS, extra
+
+    endstring = pnt + PCS
+    PCS = ""
+    if pnt_given is None:
+        if split_given:
+            # here we have to guess the POINT name and maybe an extra suf
+            # POINT name is guessed as a name without "_"
+            # the rest will be set as extra
+            split_pnt = endstring.find("_")
+            if split_pnt > -1:
+                pnt = endstring[:split_pnt]
+                extra = endstring[split_pnt + 1 :]
+            else:
+                pnt = endstring
+                extra = ""
+        else:
+            pnt = endstring
+            extra = ""
+    elif endstring.startswith(pnt_given):
+        pnt = pnt_given
+        extra = endstring[len(pnt) :]
+        if not split_given and extra != "":
+            return 4 * (None,)
+    else:
+        return 4 * (None,)
     return id_name, pnt, PCS, extra
 
 
@@ -213,43 +291,61 @@ def split_ply_path(
     {id}_ply_{line}_t{n}[_{PCS+extra}].tec
     """
     # remove the directory-part from the filepath to get the basename
-    name = os.path.basename(infile)
+    return _split_ply_name(
+        os.path.basename(infile), task_id, line_name, PCS_name, split_extra
+    )
+
+
+def split_ply_paths(
+    infiles, task_id=None, line_name=None, PCS_name=None, split_extra=False
+):
+    """
+    Retrive ogs-infos from multiple filenames for tecplot-polyline output.
+
+    Generator yielding the results of :any:`split_ply_path`
+    for each given file.
+    """
+    basename = os.path.basename
+    for infile in infiles:
+        yield _split_ply_name(
+            basename(infile), task_id, line_name, PCS_name, split_extra
+        )
+
+
+def _split_ply_name(name, task_id, line_name, PCS_name, split_extra):
+    """Retrive ogs-infos from the basename of a tecplot-polyline output."""
+    # check for the suffix (aka file ending)
+    if not name.endswith(".tec"):
+        return 5 * (None,)
+    suffix_start = len(name) - 4
     # check for the task_id
     if task_id is None:
-        prefix_pat = re.compile("_ply_")
-        id_name = name[: prefix_pat.search(name).span()[0]]
+        prefix_start = name.find("_ply_")
+        if prefix_start == -1:
+            return 5 * (None,)
+        id_name = name[:prefix_start]
     else:
-        prefix_pat = re.compile("^" + re.escape(task_id) + "_ply_")
+        if not name.startswith(task_id + "_ply_"):
+            return 5 * (None,)
         id_name = task_id
-    # search for different parts in the string
-    midtrm_pat = re.compile(r"_t\d+[\._]")
-    suffix_pat = re.compile(r"\.tec$")
-    prefix_match = prefix_pat.search(name)
-    midtrm_match = midtrm_pat.search(name)
-    suffix_match = suffix_pat.search(name)
-
-    # if anything was not found, return None for everything
-    if prefix_match is None or midtrm_match is None or suffix_match is None:
+    prefix_end = len(id_name) + 5
+    # search for the time step behind the prefix
+    step_start, step_end, step = _find_step(name, prefix_end)
+    if step is None:
         return 5 * (None,)
 
     # get the infos from the file-name
-    line = name[prefix_match.span()[1] : midtrm_match.span()[0]]
-    step = int(name[midtrm_match.span()[0] + 2 : midtrm_match.span()[1] - 1])
-    PCS = name[midtrm_match.span()[1] : suffix_match.span()[0]]
+    line = name[prefix_end:step_start]
+    PCS = name[step_end:suffix_start]
 
     if line_name is not None and line_name != line:
         return 5 * (None,)
 
     if PCS_name is None:
-        pcs_found = False
-        for pcs_sgl in PCS_TYP[1:]:
-            if PCS.startswith(pcs_sgl):
-                pcs_found = True
-                extra = PCS[len(pcs_sgl) :]
-                PCS = pcs_sgl
-                break
-        if not pcs_found:
-            extra = ""
+        pcs_match = _PCS_START_RE.match(PCS)
+        extra = ""
+        if pcs_match is not None:
+            PCS, extra = pcs_match.group(1), PCS[pcs_match.end() :]
     else:
         if PCS.startswith(PCS_name):
             extra = PCS[len(PCS_name) :]
@@ -281,27 +377,66 @@ def readpvd_single(infile):
     """
     output = {}
     # read the pvd file as XML and extract the needed file infos
-    if not os.path.isfile(infile):
+    try:
+        fin = open(infile, "rb", buffering=_READ_BUFFER)
+    except OSError:
         return output
-    info_root = ET.parse(infile).getroot()
-    pvd_info = info_root.attrib
+    pvd_info = None
     files = []
     infos = []
-    # iterate through the data collection
-    for dataset in info_root[0]:
-        files.append(dataset.attrib["file"])
-        infos.append(dataset.attrib)
-        del infos[-1]["file"]
-        if "timestep" in infos[-1]:
-            infos[-1]["timestep"] = float(infos[-1]["timestep"])
-        if "part" in infos[-1]:
-            infos[-1]["part"] = int(infos[-1]["part"])
+    # stream through the data collection and release the read data sets
+    with fin:
+        for event, elem in ET.iterparse(fin, events=("start", "end")):
+            if event == "start":
+                if pvd_info is None:
+                    pvd_info, collection = dict(elem.attrib), elem
+                elif elem.tag == "Collection":
+                    collection = elem
+                continue
+            if elem.tag != "DataSet":
+                continue
+            info = dict(elem.attrib)
+            files.append(info.pop("file"))
+            if "timestep" in info:
+                info["timestep"] = float(info["timestep"])
+            if "part" in info:
+                info["part"] = int(info["part"])
+            infos.append(info)
+            collection.clear()
     output["pvd_info"] = pvd_info
     output["files"] = files
     output["infos"] = infos
     return output
 
 
+def _readpvd_times_files(infile):
+    """
+    Read only the time steps and file names from a paraview pvd file.
+
+    Returns None, if the file can't be opened.
+    """
+    try:
+        fin = open(infile, "rb", buffering=_READ_BUFFER)
+    except OSError:
+        return None
+    collection = None
+    times = []
+    files = []
+    # stream through the data collection and release the read data sets
+    with fin:
+        for event, elem in ET.iterparse(fin, events=("start", "end")):
+            if event == "start":
+                if collection is None or elem.tag == "Collection":
+                    collection = elem
+                continue
+            if elem.tag != "DataSet":
+                continue
+            times.append(float(elem.attrib["timestep"]))
+            files.append(elem.attrib["file"])
+            collection.clear()
+    return np.array(times, dtype=float), files
+
+
 def get_output_files(task_root, task_id, pcs=None, typ="VTK", element=None):
     r"""
     Get a list of output file paths.
@@ -349,26 +484,10 @@ def get_output_files(task_root, task_id, pcs=None, typ="VTK", element=None):
     # format task_root proper as directory path
     task_root = os.path.normpath(task_root)
     if typ == "VTK":
-        # in the filename, there is a underscore before the PCS-type
-        if pcs != "":
-            pcs = "_" + pcs
-        # YEAHAA.. inconsistency
-        if pcs == "_RANDOM_WALK":
-            pcs = "_RWPT"
         # get a list of all output files "{id}0000.vtk" ... "{id}999[...]9.vtk"
-        # if pcs is RWPT the name-sheme is different
-        if pcs == "_RWPT":
-            files = glob.glob(
-                os.path.join(
-                    task_root, task_id + pcs + "_[0-9]*.particles.vtk"
-                )
-            )
-        else:
-            files = glob.glob(
-                os.path.join(
-                    task_root, task_id + pcs + "[0-9][0-9][0-9]*[0-9].vtk"
-                )
-            )
+        # (in the filename, there is a underscore before the PCS-type)
+        pattern = _VTK_GLOB.get(pcs, "_" + pcs + "[0-9][0-9][0-9]*[0-9].vtk")
+        files = glob.glob(os.path.join(task_root, task_id + pattern))
         files.sort()
     elif typ == "PVD":
         # in the filename, there is a underscore before the PCS-type
@@ -376,19 +495,13 @@ def get_output_files(task_root, task_id, pcs=None, typ="VTK", element=None):
             pcs = "_" + pcs
         infile = os.path.join(task_root, task_id + pcs + ".pvd")
         # get the pvd information about the concerned files
-        pvd_info = readpvd_single(infile)
+        pvd_info = _readpvd_times_files(infile)
         # if pvd is empty: return
-        if not pvd_info:
+        if pvd_info is None:
             return []
-        # initialize output-time
-        time = []
-        for info in pvd_info["infos"]:
-            time.append(info["timestep"])
-        time = np.array(time)
+        time, pvd_files = pvd_info
         time_sort = np.argsort(time)
-        files = []
-        for new_pos in time_sort:
-            files.append(pvd_info["files"][new_pos])
+        files = [pvd_files[i] for i in time_sort.tolist()]
     elif typ == "TEC_POINT":
         # find point output by keyword "time"
         infiles = glob.glob(
@@ -396,9 +509,8 @@ def get_output_files(task_root, task_id, pcs=None, typ="VTK", element=None):
         )
         infiles.sort()
         files = []
-        for infile in infiles:
-            # get the information from the file-name
-            _, pnt_name, file_pcs, _ = split_pnt_path(infile, task_id)
+        infos = split_pnt_paths(infiles, task_id)
+        for infile, (_, pnt_name, file_pcs, _) in zip(infiles, infos):
             # check if the given PCS type matches, else skip the file
             if file_pcs == pcs and (element is None or element == pnt_name):
                 files.append(infile)
@@ -409,9 +521,8 @@ def get_output_files(task_root, task_id, pcs=None, typ="VTK", element=None):
         # sort the infiles by name to sort it by timestep (pitfall!!!)
         infiles.sort()
         files = []
-        for infile in infiles:
-            # get the information from the file-name
-            _, line_name, _, file_pcs, _ = split_ply_path(infile, task_id)
+        infos = split_ply_paths(infiles, task_id)
+        for infile, (_, line_name, _, file_pcs, _) in zip(infiles, infos):
             # check if the given PCS type matches, else skip the file
             if file_pcs == pcs and (element is None or element == line_name):
                 files.append(infile)
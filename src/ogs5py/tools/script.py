@@ -29,7 +29,7 @@ import os
 import shutil
 
 from ogs5py.fileclasses.base import BlockFile
-from ogs5py.tools.types import MULTI_FILES, OGS_EXT, STRTYPE
+from ogs5py.tools.types import MULTI_FILES, OGS_ATTRS
 
 
 def formater(val):
@@ -41,7 +41,7 @@ def formater(val):
     val : value
         input value to be formatted
     """
-    if isinstance(val, STRTYPE):
+    if isinstance(val, str):
         # add quotes to strings
         return "'" + val + "'"
     return str(val)
@@ -322,12 +322,12 @@ def gen_script(
             )
         print(")", file=script)
 
-        for ext in OGS_EXT:
-            ogs_file = getattr(ogs_class, ext[1:])
-            if (
-                not isinstance(ogs_file, BlockFile)
-                or ext[1:] in separate_files
-            ):
+        for name in OGS_ATTRS:
+            ogs_file = getattr(ogs_class, name)
+            # empty files don't need to be added to the script
+            if ogs_file.is_empty:
+                continue
+            if not isinstance(ogs_file, BlockFile) or name in separate_files:
                 add_load_file(ogs_file, script, ogs_cls_name)
             else:
                 add_block_file(ogs_file, script, ogs_cls_name)
@@ -25,6 +25,7 @@ File related
    is_skey
    get_key
    find_key_in_list
+   sub_key_index
    format_dict
    format_content
    format_content_line
@@ -61,7 +62,6 @@ Array tools
 """
 import ast
 import collections
-import glob
 import itertools
 import os
 import sys
@@ -69,7 +69,7 @@ from copy import deepcopy as dcp
 
 import numpy as np
 
-from ogs5py.tools.types import OGS_EXT, STRTYPE
+from ogs5py.tools.types import OGS_EXT
 
 
 class Output:
@@ -77,14 +77,16 @@ class Output:
 
     Parameters
     ----------
-    file_or_name : filename or open filehandle (writable)
-        File that will be duplicated
+    file_or_name : filename or open filehandle (writable) or None
+        File that will be duplicated. If None, nothing is written to a file.
     print_log : bool, optional
         State if log should be printed. Default: True
     """
 
     def __init__(self, file_or_name, print_log=True):
-        if hasattr(file_or_name, "write") and hasattr(file_or_name, "seek"):
+        if file_or_name is None:
+            self.file = None
+        elif hasattr(file_or_name, "write") and hasattr(file_or_name, "seek"):
             self.file = file_or_name
         else:
             self.file = open(file_or_name, "w")
@@ -98,7 +100,8 @@ class Output:
     def close(self):
         """Close the file and restore the channel."""
         self.flush()
-        self.file.close()
+        if self.file is not None:
+            self.file.close()
         self._closed = True
 
     def write(self, data):
@@ -107,14 +110,16 @@ class Output:
             self.last_line = data.decode(self.encoding)
         except AttributeError:
             self.last_line = data
-        self.file.write(self.last_line)
+        if self.file is not None:
+            self.file.write(self.last_line)
         if self.print_log:
             sys.stdout.write(self.last_line)
             sys.stdout.flush()
 
     def flush(self):
         """Flush both channels."""
-        self.file.flush()
+        if self.file is not None:
+            self.file.flush()
         if self.print_log:
             sys.stdout.flush()
 
@@ -245,6 +250,29 @@ def find_key_in_list(key, key_list):
     return None
 
 
+def sub_key_index(sub_keys):
+    """
+    Get the positional index of each key in a list of sub-keywords.
+
+    If a key occurs multiple times, the first occurrence is used
+    (like ``list.index``).
+
+    Parameters
+    ----------
+    sub_keys : list of str
+        Sub-keywords of a block.
+
+    Returns
+    -------
+    index : :class:`dict`
+        The positional index for each sub-keyword.
+    """
+    index = {}
+    for i, key in enumerate(sub_keys):
+        index.setdefault(key, i)
+    return index
+
+
 def format_dict(dict_in):
     """
     Format the dictionary to use upper-case keys.
@@ -310,7 +338,7 @@ def format_content(content):
         Single object, or list of objects, or list of lists of objects.
     """
     # strings could be detected as iterable, so check this first
-    if isinstance(content, STRTYPE):
+    if isinstance(content, str):
         return [[content]]
     # convert iterators (like zip)
     if isinstance(content, collections.abc.Iterator):
@@ -331,7 +359,7 @@ def format_content(content):
         except TypeError:
             pass
         else:
-            if not isinstance(con, STRTYPE):
+            if not isinstance(con, str):
                 found_list = True
                 break
     # if a list is found, we take the content as multiple lines
@@ -349,7 +377,7 @@ def search_task_id(task_root, search_ext=None):
     ----------
     task_root : str
         Path to the destiny folder.
-    search_ext : str
+    search_ext : str or list of str
         OGS extension that should be searched for. Default: All known.
 
     Returns
@@ -359,14 +387,22 @@ def search_task_id(task_root, search_ext=None):
     """
     if search_ext is None:
         search_ext = OGS_EXT
+    elif isinstance(search_ext, str):
+        search_ext = [search_ext]
+    # scan the folder only once (hidden files are ignored like in glob)
+    try:
+        with os.scandir(task_root) as entries:
+            names = [ent.name for ent in entries if ent.name[:1] != "."]
+    except OSError:
+        names = []
     found_ids = []
     # iterate over all ogs file-extensions
     for ext in search_ext:
         # search for files with given extension
-        files = glob.glob(os.path.join(task_root, "*" + ext))
-        # take the first found file if there are multiple
-        for fil in files:
-            tmp_id = os.path.splitext(os.path.basename(fil))[0]
+        for name in names:
+            if not name.endswith(ext):
+                continue
+            tmp_id = os.path.splitext(name)[0]
             if tmp_id not in found_ids:
                 found_ids.append(tmp_id)
     return found_ids
@@ -415,7 +451,7 @@ def is_str_array(array):
 
     if array.dtype.kind == "O":
         for val in array.reshape(-1):
-            if not isinstance(val, STRTYPE):
+            if not isinstance(val, str):
                 return False
         return True
 
@@ -41,6 +41,7 @@ MSH related Constants
    VTK_TYP
    MESHIO_NAMES
    NODE_NO
+   VTK_TYP_LUT
 
 General Constants
 ^^^^^^^^^^^^^^^^^
@@ -49,9 +50,11 @@ General Constants
    STRTYPE
    PCS_TYP
    PCS_EXT
+   PCS_BY_EXT
    PRIM_VAR
    PRIM_VAR_BY_PCS
    OGS_EXT
+   OGS_ATTRS
    MULTI_FILES
 
 ----
@@ -116,18 +119,24 @@ General Constants
 
 .. autodata:: NODE_NO
 
+.. autodata:: VTK_TYP_LUT
+
 .. autodata:: STRTYPE
 
 .. autodata:: PCS_TYP
 
 .. autodata:: PCS_EXT
 
+.. autodata:: PCS_BY_EXT
+
 .. autodata:: PRIM_VAR
 
 .. autodata:: PRIM_VAR_BY_PCS
 
 .. autodata:: OGS_EXT
 
+.. autodata:: OGS_ATTRS
+
 .. autodata:: MULTI_FILES
 """
 import numpy as np
@@ -367,6 +376,11 @@ NODE_NO = {
 }
 """dict: Node numbers per element name"""
 
+# element index in ELEM_NAMES per vtk type code (vtk types are uint8)
+VTK_TYP_LUT = np.full(256, -1, dtype=int)
+VTK_TYP_LUT[[VTK_TYP[name] for name in ELEM_NAMES]] = range(len(ELEM_NAMES))
+"""np.ndarray: element index per vtk type code (-1 for unknown types)"""
+
 # all pcs types supported by OGS5
 # https://ogs5-keywords.netlify.com/ogs/wiki/public/doc-auto/by_ext/pcs/s_pcs_type
 PCS_TYP = [
@@ -395,6 +409,11 @@ PCS_TYP = [
 PCS_EXT = [""] + ["_" + pcs for pcs in PCS_TYP[1:]]
 """list: PCS file extensions with _"""
 
+# pcs type by file extension (random walk particles are written as "_RWPT")
+PCS_BY_EXT = dict(zip(PCS_EXT, PCS_TYP))
+PCS_BY_EXT["_RWPT"] = "RANDOM_WALK"
+"""dict: PCS types by file extension"""
+
 # all PRIMARY_VARIABLE types supported by OGS5 (sorted by PCS_TYP)
 PRIM_VAR = [
     [""],
@@ -450,5 +469,8 @@ OGS_EXT = [
 ]
 """list: all ogs file extensions"""
 
+OGS_ATTRS = tuple(ext[1:] for ext in OGS_EXT)
+"""tuple: attribute names of the ogs files in an OGS model (per OGS_EXT)"""
+
 MULTI_FILES = ["mpd", "gli_ext", "rfr", "gem_init", "asc"]
 """list: all ogs files that can occure multiple times"""
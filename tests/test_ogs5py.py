@@ -3,11 +3,67 @@
 This is the unittest for ogs5py.
 """
 import os
+import shutil
+import stat
+import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from ogs5py import GLI, MSH, OGS, download_ogs, hull_deform
+from ogs5py import GLI, MPD, MSH, OGS, RFR, download_ogs, hull_deform
+from ogs5py.reader import clear_cache
+from ogs5py.reader import reader as ogs_reader
+from ogs5py.reader import readtec_point, readtec_polyline, readvtk
+from ogs5py.reader.techelper import inspect_tecplot, readtec_multi_table
+from ogs5py.tools.output import (
+    split_ply_path,
+    split_ply_paths,
+    split_pnt_path,
+    split_pnt_paths,
+)
+from ogs5py.tools.tools import sub_key_index
+
+PNT_TEC = """TITLE = "Time curves in points"
+VARIABLES = "TIME " "HEAD"
+ZONE T="POINT=owell"
+0.0 -1.0
+1.0 -2.0
+2.0 -3.0
+"""
+
+PLY_TEC = """VARIABLES = "DIST" "HEAD"
+ZONE T="TIME=0.5"
+ZONETYPE=ORDERED
+-1.0 -2.5e-1
+ 0.5 3.0
+ZONE T="TIME=1.5"
+ZONETYPE=ORDERED
+-2.0 +1.0
+ .5 -4.0
+"""
+
+VTK_MESH = """# vtk DataFile Version 3.0
+test
+ASCII
+DATASET UNSTRUCTURED_GRID
+FIELD FieldData 1
+TIME 1 1 double
+{0}
+POINTS 5 double
+0 0 0 1 0 0 1 1 0 0 1 0 2 0 0
+CELLS 2 9
+4 0 1 2 3
+3 1 4 2
+CELL_TYPES 2
+9
+5
+POINT_DATA 5
+SCALARS HEAD double 1
+LOOKUP_TABLE default
+{0} {0} {0} {0} {0}
+"""
 
 
 class TestOGS(unittest.TestCase):
@@ -142,5 +198,184 @@ class TestOGS(unittest.TestCase):
         )
 
 
+class TestReader(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        clear_cache()
+
+    def tearDown(self):
+        clear_cache()
+        shutil.rmtree(self.root)
+
+    def write(self, name, content):
+        with open(os.path.join(self.root, name), "w") as fout:
+            fout.write(content)
+
+    def test_cache(self):
+        self.write("model_time_owell_GROUNDWATER_FLOW.tec", PNT_TEC)
+        args = (self.root, "model", "GROUNDWATER_FLOW")
+        # cache is opt-in
+        readtec_point(*args)
+        self.assertEqual(len(ogs_reader._READ_CACHE), 0)
+        first = readtec_point(*args, cache=True)
+        self.assertEqual(len(ogs_reader._READ_CACHE), 1)
+        # changing a result doesn't affect the cache
+        first["owell"]["HEAD"][0] = 10.0
+        first["owell"].clear()
+        second = readtec_point(*args, cache=True)
+        self.assertTrue(np.allclose(second["owell"]["HEAD"], [-1, -2, -3]))
+        # cached results are independent of each other
+        third = readtec_point(*args, cache=True)
+        self.assertFalse(
+            np.shares_memory(second["owell"]["HEAD"], third["owell"]["HEAD"])
+        )
+        clear_cache()
+        self.assertEqual(len(ogs_reader._READ_CACHE), 0)
+
+        # concurrent reading and clearing of the cache
+        def read_clear(i):
+            if i % 3 == 0:
+                clear_cache()
+            return readtec_point(*args, cache=True)["owell"]["HEAD"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for head in pool.map(read_clear, range(60)):
+                self.assertTrue(np.allclose(head, [-1, -2, -3]))
+
+    def test_vtk(self):
+        for step in range(3):
+            self.write("model{:04}.vtk".format(step), VTK_MESH.format(step))
+        # too few digits for a time step
+        self.write("model12.vtk", VTK_MESH.format(12))
+        out = readvtk(self.root, "model", None)
+        self.assertTrue(np.allclose(out["TIME"], [0, 1, 2]))
+        # cells of different types are given by their node ids
+        cells = out["DATA"][0]["cells"]
+        self.assertTrue(np.array_equal(cells["quad"], [[0, 1, 2, 3]]))
+        self.assertTrue(np.array_equal(cells["tri"], [[1, 4, 2]]))
+        stacked = readvtk(
+            self.root, "model", None, stack=True, dtype="float32", n_jobs=2
+        )
+        head = stacked["DATA"]["point_data"]["HEAD"]
+        self.assertEqual(head.shape, (3, 5))
+        self.assertEqual(head.dtype, np.float32)
+        self.assertTrue(np.allclose(head[:, 0], [0, 1, 2]))
+
+    def test_tec_zones(self):
+        self.write("model_ply_line_t0_GROUNDWATER_FLOW.tec", PLY_TEC)
+        infile = os.path.join(
+            self.root, "model_ply_line_t0_GROUNDWATER_FLOW.tec"
+        )
+        info = inspect_tecplot(infile)
+        self.assertEqual(info.zone_lines, [2, 2])
+        self.assertEqual(info.zone_names, ["TIME=0.5", "TIME=1.5"])
+        out = readtec_multi_table(infile)
+        self.assertTrue(np.allclose(out["TIME"], [0.5, 1.5]))
+        self.assertTrue(np.allclose(out["DIST"], [[-1, 0.5], [-2, 0.5]]))
+        self.assertTrue(np.allclose(out["HEAD"], [[-0.25, 3], [1, -4]]))
+
+    def test_tec_polyline_array(self):
+        self.write("model_ply_line_t0_GROUNDWATER_FLOW.tec", PLY_TEC)
+        self.write(
+            "model_ply_line_t2_GROUNDWATER_FLOW.tec",
+            PLY_TEC.split("ZONE", 2)[0] + 'ZONE T="TIME=0"\n1 2\n3 4\n5 6\n',
+        )
+        args = (self.root, "model", "GROUNDWATER_FLOW")
+        out = readtec_polyline(*args)["line"]
+        self.assertEqual(len(out), 2)
+        line = readtec_polyline(*args, as_array=True)["line"]
+        # padded with NaN for the missing ply_id and the differing sizes
+        self.assertEqual(line["HEAD"].shape, (3, 2, 3))
+        self.assertTrue(np.allclose(line["HEAD"][0, :, :2], out[0]["HEAD"]))
+        self.assertTrue(np.all(np.isnan(line["HEAD"][1])))
+        self.assertTrue(np.allclose(line["HEAD"][2, 0], [2, 4, 6]))
+        self.assertTrue(np.all(np.isnan(line["HEAD"][0, :, 2])))
+        self.assertTrue(
+            np.allclose(line["TIME"][2], [0, np.nan], equal_nan=True)
+        )
+
+    def test_split_paths(self):
+        pnt_files = [
+            os.path.join("out", "model_time_owell_GROUNDWATER_FLOW.tec"),
+            "model_time_p_1.tec",
+        ]
+        pnt_infos = list(split_pnt_paths(pnt_files))
+        self.assertEqual(pnt_infos, [split_pnt_path(f) for f in pnt_files])
+        self.assertEqual(
+            pnt_infos[0], ("model", "owell", "GROUNDWATER_FLOW", "")
+        )
+        self.assertEqual(pnt_infos[1], ("model", "p_1", "", ""))
+        ply_files = [
+            os.path.join("out", "model_ply_line_t12_MASS_TRANSPORT.tec"),
+            "model_ply_b_t0.tec",
+            "model0000.vtk",
+        ]
+        ply_infos = list(split_ply_paths(ply_files))
+        self.assertEqual(ply_infos, [split_ply_path(f) for f in ply_files])
+        self.assertEqual(
+            ply_infos[0], ("model", "line", 12, "MASS_TRANSPORT", "")
+        )
+        self.assertEqual(ply_infos[1], ("model", "b", 0, "", ""))
+        self.assertEqual(ply_infos[2], 5 * (None,))
+
+
+class TestModel(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.model = OGS(task_root=self.root, task_id="model")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_copy_files(self):
+        path = os.path.join(self.root, "data.txt")
+        with open(path, "w") as fout:
+            fout.write("data")
+        self.model.add_copy_files([path, self.root, "missing.txt"])
+        self.assertEqual(self.model.copy_files, [os.path.abspath(path)])
+
+    def test_multi_file(self):
+        self.model.mpd.extend([])
+        self.assertEqual(len(self.model.mpd), 0)
+        self.model.mpd.extend(MPD() for _ in range(2))
+        self.assertEqual(len(self.model.mpd), 2)
+        self.assertEqual(self.model.mpd.id, 1)
+
+    def test_rfr(self):
+        path = os.path.join(self.root, "model.rfr")
+        # a single row needs to be read as 2D data as well
+        for size in [5, 1]:
+            data = np.arange(2 * size, dtype=float).reshape((2, size)) / 3
+            rfr = RFR(variables=["HEAD", "CONCENTRATION1"], data=data)
+            rfr.save(path)
+            read = RFR()
+            read.read_file(path)
+            self.assertEqual(read.variables, rfr.variables)
+            self.assertEqual(read.units, rfr.units)
+            self.assertEqual(read.data.shape, (2, size))
+            self.assertTrue(np.allclose(read.data, data))
+
+    def test_sub_key_index(self):
+        index = sub_key_index(["A", "B", "A", "C"])
+        self.assertEqual(index, {"A": 0, "B": 1, "C": 3})
+
+    @unittest.skipIf(sys.platform == "win32", "needs a shell script")
+    def test_run_mode(self):
+        exe = os.path.join(self.root, "fake_ogs")
+        with open(exe, "w") as fout:
+            fout.write('#!/bin/sh\necho "fake ogs $1"\n')
+        os.chmod(exe, os.stat(exe).st_mode | stat.S_IEXEC)
+        with self.assertRaises(ValueError):
+            self.model.run_model(ogs_exe=exe, run_mode="unknown")
+        for run_mode in ["pexpect", "subprocess"]:
+            log_name = run_mode + ".txt"
+            success = self.model.run_model(
+                ogs_exe=exe, log_name=log_name, run_mode=run_mode
+            )
+            self.assertTrue(success)
+            with open(os.path.join(self.root, log_name)) as fin:
+                self.assertIn("fake ogs model", fin.read())
+
+
 if __name__ == "__main__":
     unittest.main()